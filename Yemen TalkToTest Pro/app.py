@@ -1,31 +1,55 @@
 import os
 import shutil
-from flask import Flask, request, render_template, jsonify, session, redirect, url_for
+from flask import Flask, Response, request, render_template, jsonify, redirect, url_for, g
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
 from werkzeug.utils import secure_filename
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.targets import FileTarget, ValueTarget
 from dotenv import load_dotenv
 import bcrypt
 from bson.objectid import ObjectId
-import threading
+from celery import Celery
+from concurrent.futures import ThreadPoolExecutor
 import uuid
+import hashlib
+import time
+import jwt
 
 # Import core components from your project
 from core.database_manager import DatabaseManager
+from core.cache_manager import CacheManager
 from core.message_system import MessageSystem, MessageCode
 from main import MainPipeline
+from utils.json_provider import OrjsonProvider
+from utils.file_utils import remove_directory_tree
 import config
 
 # --- App Initialization and Configuration ---
 
+def monkey_patched_threading():
+    """Return True when running inside a gevent worker that has patched the threading module."""
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched("threading")
+
 # Load environment variables from .env file
 load_dotenv()
 
 app = Flask(__name__)
-app.secret_key = os.urandom(24) # Needed for session management
+app.json = OrjsonProvider(app) # Faster JSON for jsonify() and request.get_json()
+# A stable key keeps login tokens valid across restarts and between workers
+app.secret_key = os.getenv("SECRET_KEY") or os.urandom(24)
 
 # --- Environment Variable Validation ---
 
 MONGO_CONNECTION_STRING = os.getenv("MONGO_CONNECTION_STRING")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
+CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/1")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/2")
 
 if not MONGO_CONNECTION_STRING or not OPENAI_API_KEY:
     MessageSystem.log_error(
@@ -34,13 +58,33 @@ if not MONGO_CONNECTION_STRING or not OPENAI_API_KEY:
     )
     exit(1)
 
+if not os.getenv("SECRET_KEY"):
+    MessageSystem.log_warning(
+        MessageCode.OPERATION_FAILED,
+        error="'SECRET_KEY' is not set in .env file; logins will not survive a restart or work across multiple workers."
+    )
+
 # --- Service Initialization ---
 
+def find_ffmpeg_tool(project_root, name):
+    """
+    Locate an FFmpeg executable: the bundled Windows build in bin/ if present, otherwise the one on PATH
+    (e.g. a Linux server running Gunicorn). Falls back to the bundled path so the error names it.
+    """
+    bundled_path = os.path.join(project_root, "bin", f"{name}.exe")
+    if os.path.exists(bundled_path):
+        return bundled_path
+    return shutil.which(name) or bundled_path
+
 try:
+    cache_manager = CacheManager(redis_url=REDIS_URL)
     db_manager = DatabaseManager(connection_string=MONGO_CONNECTION_STRING)
+    # Give every forked Gunicorn/Celery worker its own MongoDB connection pool
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=db_manager.reset_client)
     project_root = os.getcwd()
-    ffmpeg_exe_path = os.path.join(project_root, "bin", "ffmpeg.exe")
-    ffprobe_exe_path = os.path.join(project_root, "bin", "ffprobe.exe")
+    ffmpeg_exe_path = find_ffmpeg_tool(project_root, "ffmpeg")
+    ffprobe_exe_path = find_ffmpeg_tool(project_root, "ffprobe")
 
     # Initialize the main processing pipeline with a default quality
     pipeline = MainPipeline(
@@ -48,20 +92,99 @@ try:
         audio_quality=config.SELECTED_AUDIO_QUALITY, # Default quality
         ffmpeg_path=ffmpeg_exe_path,
         ffprobe_path=ffprobe_exe_path,
-        db_manager=db_manager
+        db_manager=db_manager,
+        cache_manager=cache_manager
     )
 except Exception as e:
     MessageSystem.log_error(MessageCode.UNEXPECTED_ERROR, error=f"Failed to initialize core services: {e}")
     exit(1)
 
-# --- Global dictionary to store job results ---
-job_results = {}
+# --- Login Protection ---
+
+# bcrypt releases the GIL while hashing, so a thread pool verifies passwords in parallel
+# on all cores without blocking the request thread's interpreter.
+# Under Gunicorn's gevent workers stdlib threads are greenlets, so use gevent's native thread pool instead.
+if monkey_patched_threading():
+    from gevent.threadpool import ThreadPoolExecutor as NativeThreadPoolExecutor
+    password_executor = NativeThreadPoolExecutor(max_workers=os.cpu_count())
+else:
+    password_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+def login_rate_limit_key():
+    """Rate-limit login attempts per client IP and target email."""
+    data = request.get_json(silent=True) or {}
+    return f"{get_remote_address()}:{str(data.get('email', '')).lower()}"
+
+limiter = Limiter(get_remote_address, app=app, storage_uri=REDIS_URL)
+
+@app.errorhandler(429)
+def rate_limit_exceeded(e):
+    return jsonify({"success": False, "error": "Too many login attempts. Please try again later."}), 429
+
+def verify_password(password, password_hash):
+    """Check a password against its bcrypt hash on the password executor."""
+    future = password_executor.submit(bcrypt.checkpw, password.encode('utf-8'), password_hash)
+    return future.result(timeout=config.PASSWORD_CHECK_TIMEOUT_SECONDS)
+
+# --- Background Task Queue ---
+
+# Pipeline jobs run on a bounded Celery worker pool instead of one thread per upload.
+# Start a worker with: celery -A app.celery worker
+celery = Celery('ttt', broker=CELERY_BROKER_URL, backend=CELERY_RESULT_BACKEND)
+celery.conf.update(
+    worker_concurrency=os.cpu_count(),
+    worker_prefetch_multiplier=1,
+    task_acks_late=True, # Re-deliver jobs if a worker dies mid-pipeline
+    # Without this, Redis re-delivers any job still running after an hour and it runs twice
+    broker_transport_options={'visibility_timeout': config.CELERY_VISIBILITY_TIMEOUT_SECONDS},
+    # The default prefork pool does not work on Windows; threads do, and the pipeline mostly waits on FFmpeg and the API
+    worker_pool='threads' if os.name == 'nt' else 'prefork',
+)
+
+# --- Auth Tokens ---
+
+# A signed token identifies the user, so authenticated requests are verified locally
+# (HMAC-SHA256) without a server-side session store.
+def issue_auth_token(user_id, user_name):
+    now = int(time.time())
+    return jwt.encode({"uid": str(user_id), "name": user_name, "iat": now, "exp": now + config.AUTH_TOKEN_TTL_SECONDS},
+                      app.secret_key, algorithm="HS256")
+
+def set_auth_cookie(response, token):
+    response.set_cookie(config.AUTH_COOKIE_NAME, token, max_age=config.AUTH_TOKEN_TTL_SECONDS, httponly=True,
+                        secure=app.config['SESSION_COOKIE_SECURE'], samesite="Lax")
+    return response
+
+# --- Request Hooks ---
+
+@app.before_request
+def load_current_user():
+    """
+    Identify the logged-in user from the auth token cookie once per request;
+    handlers use g.user_id (None if logged out or the token is invalid or expired).
+    """
+    g.user_id, g.user_name, g.auth_claims = None, None, None
+    token = request.cookies.get(config.AUTH_COOKIE_NAME)
+    if token:
+        try:
+            g.auth_claims = jwt.decode(token, app.secret_key, algorithms=["HS256"])
+            g.user_id, g.user_name = ObjectId(g.auth_claims["uid"]), g.auth_claims.get("name")
+        except (jwt.InvalidTokenError, KeyError):
+            g.auth_claims = None
+
+@app.after_request
+def refresh_auth_token(response):
+    """Re-issue the auth token for active users once less than half of its lifetime remains."""
+    claims = g.get('auth_claims')
+    if claims and claims["exp"] - time.time() < config.AUTH_TOKEN_TTL_SECONDS / 2 and request.endpoint != 'logout':
+        set_auth_cookie(response, issue_auth_token(claims["uid"], claims.get("name")))
+    return response
 
 # --- User Authentication Routes ---
 
 @app.route("/")
 def index():
-    if 'user_id' in session:
+    if g.user_id is not None:
         return redirect(url_for('dashboard'))
     return redirect(url_for('login'))
 
@@ -90,6 +213,7 @@ def signup():
     return render_template("signup.html")
 
 @app.route("/login", methods=["GET", "POST"])
+@limiter.limit(config.LOGIN_RATE_LIMIT, key_func=login_rate_limit_key, methods=["POST"])
 def login():
     if request.method == "POST":
         try:
@@ -98,10 +222,8 @@ def login():
             if not email or not password:
                 return jsonify({"success": False, "error": "Please provide both email and password."}), 400
             user = db_manager.get_user_by_email(email)
-            if user and bcrypt.checkpw(password.encode('utf-8'), user['passwordHash']):
-                session['user_id'] = str(user['_id'])
-                session['user_name'] = user['firstName']
-                return jsonify({"success": True})
+            if user and verify_password(password, user['passwordHash']):
+                return set_auth_cookie(jsonify({"success": True}), issue_auth_token(user['_id'], user['firstName']))
             else:
                 return jsonify({"success": False, "error": "Invalid email or password."}), 401
         except Exception as e:
@@ -111,40 +233,55 @@ def login():
 
 @app.route("/logout")
 def logout():
-    session.clear()
-    return redirect(url_for('login'))
+    response = redirect(url_for('login'))
+    response.delete_cookie(config.AUTH_COOKIE_NAME)
+    return response
 
 # --- Main Application Routes ---
 
 @app.route("/dashboard")
 def dashboard():
-    if 'user_id' not in session:
+    if g.user_id is None:
         return redirect(url_for('login'))
-    return render_template("index.html", user_name=session.get('user_name'))
+    return render_template("index.html", user_name=g.user_name)
+
+def set_processing_state(job_id, stage=None):
+    """Mark a job as processing in Redis, optionally with its current pipeline stage."""
+    state = {"status": "processing"}
+    if stage:
+        state["stage"] = stage
+    cache_manager.set_job_state(job_id, state, ttl_seconds=config.JOB_PROCESSING_STATE_TTL_SECONDS)
 
-def run_pipeline_in_background(job_id, input_path, user_id, audio_quality, target_language, is_url=False, original_filepath=None):
+@celery.task(bind=True, ignore_result=True)
+def run_pipeline_task(self, input_path, user_id_str, audio_quality, target_language, is_url=False, original_filepath=None, content_hash=None):
     """
-    Function to run the pipeline and store its result.
+    Celery task that runs the pipeline and stores its result in Redis.
+    The Celery task id doubles as the job id exposed to the client.
     Crucially, it ensures immediate cleanup of all associated files in a finally block.
     """
+    job_id = self.request.id
     temp_dir_path = f"temp_{job_id}"
     try:
+        # Refresh the processing state now and at every stage, so it outlives queue waits and long runs
+        set_processing_state(job_id)
         final_results = pipeline.run(
             input_path_or_url=input_path, 
-            user_id=user_id,
+            user_id=ObjectId(user_id_str),
             audio_quality=audio_quality,
             target_language_name=target_language,
-            job_id_for_temp_dir=job_id # Pass job_id to create the correct temp dir
+            job_id_for_temp_dir=job_id, # Pass job_id to create the correct temp dir
+            content_hash=content_hash,
+            on_stage=lambda stage: set_processing_state(job_id, stage)
         )
-        job_results[job_id] = {"status": "completed", "data": final_results}
+        cache_manager.set_job_state(job_id, {"status": "completed", "data": final_results})
     except Exception as e:
-        job_results[job_id] = {"status": "failed", "error": str(e)}
+        cache_manager.set_job_state(job_id, {"status": "failed", "error": str(e)})
     finally:
         # --- IMMEDIATE AND ROBUST CLEANUP ---
         # 1. Clean up the temporary directory for this job
         if os.path.exists(temp_dir_path):
             try:
-                shutil.rmtree(temp_dir_path)
+                remove_directory_tree(temp_dir_path)
                 MessageSystem.log_success(MessageCode.PIPELINE_CLEANUP, temp_dir=temp_dir_path)
             except OSError as e:
                 MessageSystem.log_error(MessageCode.UNEXPECTED_ERROR, error=f"Error cleaning up temp directory {temp_dir_path}: {e}")
@@ -157,37 +294,94 @@ def run_pipeline_in_background(job_id, input_path, user_id, audio_quality, targe
             except OSError as e:
                 MessageSystem.log_error(MessageCode.UNEXPECTED_ERROR, error=f"Error cleaning up uploaded file {original_filepath}: {e}")
 
+class HashingFileTarget(FileTarget):
+    """FileTarget that also feeds every chunk it writes into a SHA-256 digest."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.digest = hashlib.sha256()
+
+    def on_data_received(self, chunk: bytes):
+        super().on_data_received(chunk)
+        self.digest.update(chunk)
+
+def stream_upload_to_disk(upload_folder):
+    """
+    Parse the multipart body straight from the request stream, writing the 'file' part to disk
+    in fixed-size chunks so memory use stays bounded by the chunk size, not the upload size.
+    The file is hashed as it streams, so deduplication costs no extra pass over the data.
+    Returns the saved file path (None if no file was selected), its SHA-256 and the other form fields.
+    If reading or parsing fails (client disconnect, malformed body), the partial file is removed.
+    """
+    os.makedirs(upload_folder, exist_ok=True)
+    unique_prefix = str(uuid.uuid4())
+    partial_path = os.path.join(upload_folder, unique_prefix + ".part")
+
+    file_target = HashingFileTarget(partial_path)
+    form_targets = {"accuracy": ValueTarget(), "language": ValueTarget()}
+
+    try:
+        parser = StreamingFormDataParser(headers={"Content-Type": request.content_type})
+        parser.register("file", file_target)
+        for name, target in form_targets.items():
+            parser.register(name, target)
+
+        while chunk := request.stream.read(config.UPLOAD_CHUNK_SIZE_BYTES):
+            parser.data_received(chunk)
+
+        form = {name: target.value.decode("utf-8") for name, target in form_targets.items() if target.value}
+    except BaseException:
+        file_target.on_finish() # Close the partial file if the parser left it open
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+    if not file_target.multipart_filename:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        return None, None, form
+
+    filepath = os.path.join(upload_folder, unique_prefix + "_" + secure_filename(file_target.multipart_filename))
+    os.replace(partial_path, filepath)
+    return filepath, file_target.digest.hexdigest(), form
+
 
 @app.route("/upload_audio", methods=["POST"])
 def upload_audio():
-    if 'user_id' not in session:
+    if g.user_id is None:
         return jsonify({"success": False, "error": "User not authenticated."}), 401
 
-    if 'file' not in request.files:
+    if not (request.content_type or "").startswith("multipart/form-data"):
         return jsonify({"success": False, "error": "No file part in the request."}), 400
 
-    file = request.files['file']
-    if file.filename == '':
-        return jsonify({"success": False, "error": "No file selected."}), 400
-
     try:
-        audio_quality = request.form.get('accuracy', 'medium').lower()
-        target_language = request.form.get('language', 'auto').capitalize()
-        user_id = ObjectId(session['user_id'])
+        filepath, content_hash, form = stream_upload_to_disk('uploads')
+        if not filepath:
+            return jsonify({"success": False, "error": "No file selected."}), 400
 
-        upload_folder = 'uploads'
-        os.makedirs(upload_folder, exist_ok=True)
-        unique_filename = str(uuid.uuid4()) + "_" + secure_filename(file.filename)
-        filepath = os.path.join(upload_folder, unique_filename)
-        file.save(filepath)
+        audio_quality = form.get('accuracy', 'medium').lower()
+        target_language = form.get('language', 'auto').capitalize()
+        user_id = str(g.user_id)
 
         job_id = str(uuid.uuid4())
-        job_results[job_id] = {"status": "processing"}
 
-        thread = threading.Thread(target=run_pipeline_in_background, args=(
-            job_id, filepath, user_id, audio_quality, target_language, False, filepath # Pass filepath for cleanup
-        ))
-        thread.start()
+        # Identical audio this user already processed: reuse the stored results instead of re-running the pipeline
+        existing_job = db_manager.find_job_by_hash(content_hash, g.user_id, audio_quality)
+        if existing_job and target_language.lower() != 'auto':
+            translated_report = existing_job.get("processing", {}).get("summary", {}).get("translatedReport") or {}
+            if translated_report.get("language") != target_language:
+                existing_job = None # Same audio, but the requested translation was never produced
+        if existing_job:
+            os.remove(filepath)
+            MessageSystem.log_info(MessageCode.PIPELINE_DUPLICATE_UPLOAD, job_id=existing_job["_id"])
+            cache_manager.set_job_state(job_id, {"status": "completed", "data": existing_job.get("processing", {})})
+            return jsonify({"success": True, "message": "Results already available.", "job_id": job_id})
+
+        set_processing_state(job_id)
+
+        run_pipeline_task.apply_async(args=(
+            filepath, user_id, audio_quality, target_language, False, filepath, content_hash # Pass filepath for cleanup
+        ), task_id=job_id)
 
         return jsonify({"success": True, "message": "Processing started.", "job_id": job_id})
 
@@ -197,7 +391,7 @@ def upload_audio():
 
 @app.route("/upload_url", methods=["POST"])
 def upload_url():
-    if 'user_id' not in session:
+    if g.user_id is None:
         return jsonify({"success": False, "error": "User not authenticated."}), 401
     
     try:
@@ -208,15 +402,14 @@ def upload_url():
 
         audio_quality = data.get('accuracy', 'medium').lower()
         target_language = data.get('language', 'auto').capitalize()
-        user_id = ObjectId(session['user_id'])
-        
+        user_id = str(g.user_id)
+
         job_id = str(uuid.uuid4())
-        job_results[job_id] = {"status": "processing"}
+        set_processing_state(job_id)
 
-        thread = threading.Thread(target=run_pipeline_in_background, args=(
-            job_id, url, user_id, audio_quality, target_language, True, None # No original file to cleanup
-        ))
-        thread.start()
+        run_pipeline_task.apply_async(args=(
+            url, user_id, audio_quality, target_language, True, None # No original file to cleanup
+        ), task_id=job_id)
 
         return jsonify({"success": True, "message": "Processing started.", "job_id": job_id})
 
@@ -226,23 +419,59 @@ def upload_url():
 
 @app.route("/job_status/<job_id>", methods=["GET"])
 def get_job_status(job_id):
-    if 'user_id' not in session:
+    if g.user_id is None:
         return jsonify({"success": False, "error": "User not authenticated."}), 401
     
-    result = job_results.get(job_id)
+    result = cache_manager.get_job_state(job_id)
     if not result:
         return jsonify({"success": False, "error": "Job not found."}), 404
         
     return jsonify({"success": True, "status": result.get("status"), "data": result.get("data"), "error": result.get("error")})
 
+@app.route("/job_events/<job_id>", methods=["GET"])
+def job_events(job_id):
+    """
+    Stream job state changes as Server-Sent Events until the job completes or fails,
+    replacing repeated /job_status polling with one long-lived connection.
+    """
+    if g.user_id is None:
+        return jsonify({"success": False, "error": "User not authenticated."}), 401
+
+    # Subscribe before reading the current state so no transition is missed in between
+    pubsub = cache_manager.subscribe_job_state(job_id)
+    state = cache_manager.get_job_state(job_id)
+    if not state:
+        pubsub.close()
+        return jsonify({"success": False, "error": "Job not found."}), 404
+
+    def generate(state):
+        try:
+            while True:
+                if state:
+                    yield f"data: {app.json.dumps(state)}\n\n"
+                    if state.get("status") in ("completed", "failed"):
+                        return
+                message = pubsub.get_message(timeout=config.JOB_EVENTS_KEEPALIVE_SECONDS)
+                if message is None:
+                    state = None
+                    yield ": keep-alive\n\n"
+                else:
+                    state = app.json.loads(message["data"])
+        finally:
+            pubsub.close()
+
+    return Response(generate(state), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
 @app.route("/history", methods=["GET"])
 def get_history():
-    if 'user_id' not in session:
+    if g.user_id is None:
         return jsonify([]), 401
     
     try:
-        user_id = ObjectId(session['user_id'])
-        jobs = db_manager.get_user_jobs(user_id)
+        user_id = g.user_id
+        page = request.args.get('page', 1, type=int)
+        jobs = db_manager.get_user_jobs(user_id, page=page)
         
         history_list = []
         for job in jobs:
@@ -262,7 +491,11 @@ def get_history():
                 "formats": job.get("processing", {})
             })
             
-        return jsonify(history_list)
+        response = jsonify(history_list)
+        # A full page means older jobs may follow; the client offers to load them
+        if len(jobs) == config.HISTORY_PAGE_SIZE:
+            response.headers["X-Next-Page"] = str(max(page, 1) + 1)
+        return response
 
     except Exception as e:
         MessageSystem.log_error(MessageCode.UNEXPECTED_ERROR, error=f"Failed to fetch history: {e}")
@@ -271,11 +504,11 @@ def get_history():
 # --- START: NEW DELETE ROUTES ---
 @app.route("/history/delete/<job_id>", methods=["DELETE"])
 def delete_history_item(job_id):
-    if 'user_id' not in session:
+    if g.user_id is None:
         return jsonify({"success": False, "error": "User not authenticated."}), 401
     
     try:
-        user_id = ObjectId(session['user_id'])
+        user_id = g.user_id
         success = db_manager.soft_delete_job(ObjectId(job_id), user_id)
         if success:
             return jsonify({"success": True, "message": "Item hidden successfully."})
@@ -287,11 +520,11 @@ def delete_history_item(job_id):
 
 @app.route("/history/clear_all", methods=["POST"])
 def clear_all_history():
-    if 'user_id' not in session:
+    if g.user_id is None:
         return jsonify({"success": False, "error": "User not authenticated."}), 401
     
     try:
-        user_id = ObjectId(session['user_id'])
+        user_id = g.user_id
         deleted_count = db_manager.soft_delete_all_user_jobs(user_id)
         return jsonify({"success": True, "message": f"{deleted_count} items hidden."})
     except Exception as e:
@@ -27,16 +27,84 @@ AUDIO_CLEANING_FILTERS = [
 # File size limits
 MAX_AUDIO_CHUNK_SIZE_MB = 25
 
+# Lines of FFmpeg stderr kept for error messages (older output is discarded as it streams)
+FFMPEG_STDERR_TAIL_LINES = 50
+
+# Uploads are streamed to disk in blocks of this size instead of being buffered whole
+UPLOAD_CHUNK_SIZE_BYTES = 1024 * 1024  # 1 MiB
+
 # Text Processing Configuration
 TEXT_CHUNK_SIZE_CHARS = 50000
 
+# MongoDB Connection Pool Configuration
+MONGO_MAX_POOL_SIZE = 50
+MONGO_MIN_POOL_SIZE = 5
+MONGO_WAIT_QUEUE_TIMEOUT_MS = 2000          # Max wait for a free pooled connection
+MONGO_SERVER_SELECTION_TIMEOUT_MS = 2000    # Fail fast when MongoDB is unreachable
+MONGO_WRITE_CONCERN_W = 1                   # Acknowledge writes from the primary only
+MONGO_APP_NAME = "TalkToText"               # Shown in MongoDB server logs and profiler
+
+# Authentication Configuration
+LOGIN_RATE_LIMIT = "10 per minute"      # Per client IP + email, POST /login only
+PASSWORD_CHECK_TIMEOUT_SECONDS = 2      # Max wait for a bcrypt verification
+BCRYPT_ROUNDS = 12                      # bcrypt cost factor for new password hashes (each +1 doubles the work)
+AUTH_COOKIE_NAME = "ttt_auth"           # HttpOnly cookie carrying the signed login token
+AUTH_TOKEN_TTL_SECONDS = 43200          # Token lifetime (outlasts the longest job); re-issued once less than half remains
+
+# History Configuration
+HISTORY_PAGE_SIZE = 50  # Jobs returned per /history page
+
+# Cache Configuration
+JOB_STATE_TTL_SECONDS = 3600  # How long job status/results stay available to /job_status
+JOB_PROCESSING_STATE_TTL_SECONDS = 43200  # Lifetime of a queued/running job's state; refreshed at every pipeline stage
+JOB_EVENTS_KEEPALIVE_SECONDS = 15  # Idle interval between keep-alive comments on /job_events streams
+CLASSIFICATION_CACHE_TTL_SECONDS = 86400  # How long URL/clip screening decisions are reused
+SUMMARY_CACHE_TTL_SECONDS = 86400  # How long a generated summary is reused for an identical transcript
+
+# Background Task Configuration
+# With late acks, Redis re-delivers a job not acknowledged within this window, so it must exceed
+# the longest pipeline run plus the time a job can wait prefetched behind another one
+CELERY_VISIBILITY_TIMEOUT_SECONDS = 43200
+
 # AI Model Configuration
 WHISPER_MODEL = "whisper-1"
 SUMMARIZATION_MODEL = "gpt-5"          # Model for generating summaries.
 TRANSLATION_MODEL = "gpt-5-mini"       # Model for translating transcripts and summaries.
 CLASSIFICATION_MODEL = "gpt-5-nano"    # A fast, cheap model for simple classification tasks.
+CLASSIFICATION_REASONING_EFFORT = "minimal"  # Screening decisions are one enum value; skip long reasoning
 PRE_SCREEN_DURATION_SECONDS = 120  # Duration for initial content relevance check
 
+# Threads that write transcripts and reports to MongoDB while the pipeline moves on to the next AI call
+PROCESSING_DATA_WRITERS = 4
+
+# Consecutive chunk summaries at least this similar (difflib ratio) are treated as duplicates before merging
+SUMMARY_DUPLICATE_RATIO = 0.9
+
+# Language detection fast path: a sample that is almost all ASCII and rich in English
+# function words is treated as English without running langdetect
+ENGLISH_FAST_PATH_MIN_ASCII_RATIO = 0.95
+ENGLISH_FAST_PATH_MIN_STOPWORD_RATIO = 0.15
+
+# Audio files are streamed to Whisper through a read buffer of this size rather than loaded whole
+WHISPER_UPLOAD_BUFFER_BYTES = 64 * 1024
+
+# Maximum number of requests in flight at once per stage (tune to the account's rate/TPM limits)
+TRANSCRIPTION_CONCURRENCY = 8
+TRANSLATION_CONCURRENCY = 6
+SUMMARIZATION_CONCURRENCY = 6
+
+# Shared HTTP/2 connection pools for the OpenAI clients
+OPENAI_MAX_CONNECTIONS = 64
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 32
+OPENAI_KEEPALIVE_EXPIRY_SECONDS = 120   # Keep idle connections warm between pipeline stages and jobs
+OPENAI_TIMEOUT_SECONDS = 300            # Per-request limit; long Whisper chunks need minutes
+OPENAI_CONNECT_TIMEOUT_SECONDS = 10
+
+# Backoff for 429 rate-limit errors: exponential with jitter, capped per wait and in attempts
+RATE_LIMIT_RETRY_INITIAL_SECONDS = 1
+RATE_LIMIT_RETRY_MAX_SECONDS = 30
+RATE_LIMIT_RETRY_ATTEMPTS = 6
+
 # System Prompts
 TRANSLATION_PROMPT = """
 You are an expert translator. Your sole task is to translate the following text accurately to English.
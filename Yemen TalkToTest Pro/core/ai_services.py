@@ -4,35 +4,192 @@ Handles all AI-powered operations including transcription, translation, and summ
 """
 
 import os
-from openai import OpenAI, APIError
-from typing import List, Dict, Any
+import re
+import json
+import asyncio
+import hashlib
+import threading
+import difflib
+import httpx
+from openai import OpenAI, AsyncOpenAI, APIError, RateLimitError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+from typing import List, Dict, Any, Callable, Coroutine, Iterable, Optional, Union
 from langdetect import detect, LangDetectException
 
 from utils.custom_exceptions import TranscriptionError, ApiServiceError, LanguageDetectionError, IrrelevantContentError
 from core.message_system import MessageSystem, MessageCode
 from core.text_processor import TextProcessor
+from core.cache_manager import CacheManager
+from utils.file_utils import sha256_file
 import config
 
+# Separator placed between chunk summaries in the merge prompt
+SUMMARY_PART_SEPARATOR = "\n\n---\n[End of Part]\n---\n\n"
+
+# Instruction that precedes a transcript chunk in the map-step prompt
+SUMMARY_CHUNK_INSTRUCTION = "Please summarize this chunk of the meeting transcript:\n\n"
+
+# Instruction that precedes the chunk summaries in the merge prompt
+SUMMARY_MERGE_INSTRUCTION = (
+    "You have been provided with summaries from different parts of a single meeting. "
+    "Synthesize them into one final, cohesive summary that follows all required output sections "
+    "(Abstract Summary, Key Points, etc.). Ensure the final output is a single, unified document.\n\n"
+)
+
+# Most frequent English function words; a high share of them in ASCII text is a reliable English signal
+ENGLISH_STOPWORDS = frozenset({
+    "the", "and", "of", "to", "a", "in", "is", "that", "it", "for", "you", "we", "this",
+    "on", "with", "are", "be", "as", "was", "have", "so", "not", "they", "i", "but", "at"
+})
+
+def _raise_rate_limit_exhausted(retry_state):
+    """Surface a rate limit that outlasted every retry as a regular pipeline API error."""
+    raise ApiServiceError(
+        f"OpenAI rate limit persisted after {retry_state.attempt_number} attempts: {retry_state.outcome.exception()}"
+    )
+
+# Retries a call that hit the account's rate limit instead of failing the whole stage;
+# jitter keeps the concurrent calls of one stage from retrying in lockstep.
+retry_on_rate_limit = retry(
+    retry=retry_if_exception_type(RateLimitError),
+    wait=wait_exponential_jitter(initial=config.RATE_LIMIT_RETRY_INITIAL_SECONDS, max=config.RATE_LIMIT_RETRY_MAX_SECONDS),
+    stop=stop_after_attempt(config.RATE_LIMIT_RETRY_ATTEMPTS),
+    retry_error_callback=_raise_rate_limit_exhausted
+)
+
 class AIServices:
     """
     Handles all AI-powered operations using OpenAI services and language detection.
     """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache_manager: CacheManager = None):
         """
         Initialize AI Services with OpenAI client and text processor.
         
         Args:
             api_key (str): OpenAI API key for authentication
+            cache_manager (CacheManager): Optional Redis cache for reusing classification decisions and summaries
             
         Raises:
             ApiServiceError: If OpenAI client initialization fails
         """
         try:
-            self.client = OpenAI(api_key=api_key)
+            # Pooled HTTP/2 clients let concurrent Whisper and chat calls share TLS connections, and a
+            # long keep-alive keeps them open between stages instead of re-handshaking every few seconds
+            limits = httpx.Limits(
+                max_connections=config.OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=config.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=config.OPENAI_KEEPALIVE_EXPIRY_SECONDS
+            )
+            timeout = httpx.Timeout(config.OPENAI_TIMEOUT_SECONDS, connect=config.OPENAI_CONNECT_TIMEOUT_SECONDS)
+            self.client = OpenAI(
+                api_key=api_key,
+                timeout=timeout,
+                http_client=httpx.Client(http2=True, limits=limits)
+            )
+            self.aclient = AsyncOpenAI(
+                api_key=api_key,
+                timeout=timeout,
+                http_client=httpx.AsyncClient(http2=True, limits=limits)
+            )
             self.internal_text_processor = TextProcessor()
         except Exception as e:
             raise ApiServiceError(f"Failed to initialize OpenAI client. Is the API key valid? Error: {e}")
+
+        self.cache_manager = cache_manager
+
+        # Background event loop for concurrent API calls, started lazily on first use
+        self._loop = None
+        self._loop_thread = None
+        self._loop_lock = threading.Lock()
+
+    def _run_async(self, coro: Coroutine) -> Any:
+        """
+        Run a coroutine on the background event loop and block until it finishes.
+        
+        A single long-lived loop (rather than asyncio.run per call) keeps the AsyncOpenAI
+        connection pool valid between calls. The loop is (re)started if its thread is not
+        alive, e.g. in a freshly forked worker process.
+        
+        Args:
+            coro (Coroutine): Coroutine to execute
+            
+        Returns:
+            Any: The coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Return the background event loop, starting its thread if it is not running.
+        """
+        with self._loop_lock:
+            if self._loop_thread is None or not self._loop_thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+                self._loop_thread.start()
+            return self._loop
+
+    async def _map_concurrently(self, limit: int, func: Callable[..., Coroutine], items: List[Any],
+                                return_exceptions: bool = False) -> List[Any]:
+        """
+        Await func(index, total, item) for every item with at most `limit` calls in flight.
+        
+        Args:
+            limit (int): Maximum number of concurrent calls
+            func (Callable): Coroutine function taking (index, total, item); index is 1-based
+            items (List[Any]): Items to process
+            return_exceptions (bool): Return failures in place of results instead of raising the first one
+            
+        Returns:
+            List[Any]: Results in the same order as `items`
+        """
+        semaphore = asyncio.Semaphore(limit)
+        total = len(items)
+
+        async def run(index: int, item: Any) -> Any:
+            async with semaphore:
+                return await func(index, total, item)
+
+        return await asyncio.gather(*(run(i, item) for i, item in enumerate(items, 1)), return_exceptions=return_exceptions)
+
+    def _classify(self, prompt: str, schema_name: str, choices: List[str]) -> Optional[str]:
+        """
+        Ask the classification model for a single decision constrained to `choices`.
+        
+        A strict JSON schema makes the reply one enum value, so it needs no free-text parsing
+        and costs only a handful of output tokens.
+        
+        Args:
+            prompt (str): Classification prompt
+            schema_name (str): Name of the response schema
+            choices (List[str]): Allowed decisions
+            
+        Returns:
+            Optional[str]: The lower-cased decision, or None if the reply could not be parsed
+        """
+        response = self.client.chat.completions.create(
+            model=config.CLASSIFICATION_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": schema_name,
+                    "strict": True,
+                    "schema": {
+                        "type": "object",
+                        "properties": {"decision": {"type": "string", "enum": choices}},
+                        "required": ["decision"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            reasoning_effort=config.CLASSIFICATION_REASONING_EFFORT
+        )
+        try:
+            return json.loads(response.choices[0].message.content)["decision"].lower()
+        except (TypeError, ValueError, KeyError):
+            return None
         
     def classify_url_metadata(self, metadata: Dict[str, Any]) -> str:
         """
@@ -54,25 +211,29 @@ class AIServices:
             description = description[:1500] + "..."
             
         tags = metadata.get("tags", [])
+        tags_text = ", ".join(tags) if tags else "N/A"
+
+        # Identical metadata always gets the same decision, so reuse it instead of calling the model
+        cache_key = "url:" + hashlib.sha256(f"{title}|{description}|{tags_text}".encode("utf-8")).hexdigest()
+        if self.cache_manager:
+            cached_decision = self.cache_manager.get_classification(cache_key)
+            if cached_decision:
+                MessageSystem.log_success(MessageCode.AI_METADATA_ANALYSIS_COMPLETE, decision=cached_decision.upper())
+                return cached_decision
         
         try:
             prompt = config.URL_METADATA_CLASSIFICATION_PROMPT.format(
                 title=title,
                 description=description,
-                tags=", ".join(tags) if tags else "N/A"
+                tags=tags_text
             )
             
-            response = self.client.chat.completions.create(
-                model=config.CLASSIFICATION_MODEL,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=10,
-                # temperature=0.0
-            )
-            
-            decision = response.choices[0].message.content.strip().lower()
+            decision = self._classify(prompt, "url_metadata_classification", ["Proceed", "Reject", "Uncertain"])
 
             # Validate AI response
             if decision in ["proceed", "reject", "uncertain"]:
+                if self.cache_manager:
+                    self.cache_manager.set_classification(cache_key, decision)
                 MessageSystem.log_success(MessageCode.AI_METADATA_ANALYSIS_COMPLETE, decision=decision.upper())
                 return decision
             else:
@@ -96,30 +257,33 @@ class AIServices:
             IrrelevantContentError: If content is classified as irrelevant
         """
         MessageSystem.log_progress(MessageCode.AI_CONTENT_SCREENING)
+
+        # A clip with identical bytes was already screened; reuse its decision
+        cache_key = f"clip:{sha256_file(audio_clip_path)}" if self.cache_manager else None
+        decision = self.cache_manager.get_classification(cache_key) if cache_key else None
         
         try:
-            # Transcribe the screening clip
-            with open(audio_clip_path, "rb") as audio_file:
-                transcription = self.client.audio.transcriptions.create(
-                    model=config.WHISPER_MODEL,
-                    file=audio_file
-                ).text.strip()
+            if decision is None:
+                # Transcribe the screening clip
+                with open(audio_clip_path, "rb", buffering=config.WHISPER_UPLOAD_BUFFER_BYTES) as audio_file:
+                    transcription = self.client.audio.transcriptions.create(
+                        model=config.WHISPER_MODEL,
+                        file=(os.path.basename(audio_clip_path), audio_file, "audio/mpeg")
+                    ).text.strip()
 
-            # Handle empty transcription (likely music or silence)
-            if not transcription:
-                raise IrrelevantContentError("The beginning of the audio contains no discernible speech.")
+                # Handle empty transcription (likely music or silence)
+                if not transcription:
+                    raise IrrelevantContentError("The beginning of the audio contains no discernible speech.")
 
-            # Classify transcript content using GPT-4o-mini
-            prompt = config.CONTENT_CLASSIFICATION_PROMPT.format(text=transcription)
-            response = self.client.chat.completions.create(
-                model=config.CLASSIFICATION_MODEL,
-                messages=[{"role": "user", "content": prompt}],
-                # temperature=0.0
-            )
-            
-            decision = response.choices[0].message.content.strip().lower()
+                # Classify transcript content using GPT-5 nano
+                prompt = config.CONTENT_CLASSIFICATION_PROMPT.format(text=transcription)
+                decision = self._classify(prompt, "content_classification", ["Relevant", "Irrelevant"])
+                if decision is None:
+                    decision = "relevant" # Unparsable reply: proceed rather than block a possibly valid job
+                elif cache_key:
+                    self.cache_manager.set_classification(cache_key, decision)
 
-            if 'irrelevant' in decision:
+            if decision == "irrelevant":
                 raise IrrelevantContentError(
                     "Content identified as irrelevant (e.g., movie, music, anime). Processing halted."
                 )
@@ -167,12 +331,65 @@ class AIServices:
         except APIError as e:
             raise ApiServiceError(f"API error during summary translation: {e}")
 
-    def transcribe_audio_files(self, audio_files: List[str]) -> str:
+    @retry_on_rate_limit
+    async def _transcribe_file(self, index: int, total_files: Union[int, str], file_path: str) -> str:
+        """
+        Transcribe a single audio file with Whisper.
+        total_files is only used for progress logging ('?' while chunks are still being produced).
+        """
+        MessageSystem.log_progress(MessageCode.TRANSCRIPTION_CHUNK_PROGRESS,
+                                 current=index, total=total_files, filename=os.path.basename(file_path))
+        try:
+            # Pass the open handle so the request body is streamed in buffer-sized blocks
+            with open(file_path, "rb", buffering=config.WHISPER_UPLOAD_BUFFER_BYTES) as audio_file:
+                transcription = await self.aclient.audio.transcriptions.create(
+                    model=config.WHISPER_MODEL,
+                    file=(os.path.basename(file_path), audio_file, "audio/mpeg")
+                )
+            return transcription.text.strip()
+            
+        except RateLimitError:
+            raise
+        except APIError as e:
+            raise TranscriptionError(f"OpenAI API error during transcription of {file_path}: {e}")
+        except Exception as e:
+            raise TranscriptionError(f"Unexpected error during transcription of {file_path}: {e}")
+
+    async def _consume_transcription_queue(self, queue: asyncio.Queue) -> List[str]:
+        """
+        Transcribe (index, path) items from the queue with a fixed pool of consumer tasks until
+        the None sentinel arrives. Returns the transcripts ordered by index.
+        """
+        transcripts = {}
+
+        async def consume():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    queue.put_nowait(None) # Pass the sentinel on to the other consumers
+                    return
+                index, file_path = item
+                transcripts[index] = await self._transcribe_file(index, "?", file_path)
+
+        consumers = [asyncio.ensure_future(consume()) for _ in range(config.TRANSCRIPTION_CONCURRENCY)]
+        try:
+            await asyncio.gather(*consumers)
+        except BaseException:
+            for consumer in consumers:
+                consumer.cancel()
+            raise
+        return [transcripts[index] for index in sorted(transcripts)]
+
+    def transcribe_audio_stream(self, audio_files: Iterable[str]) -> str:
         """
-        Transcribe list of audio files using OpenAI Whisper and merge results.
+        Transcribe audio files as they are produced and merge results.
+        
+        The calling thread drives the (possibly blocking) producer and queues each file for
+        the consumers on the background loop, so Whisper works on early chunks while later
+        ones are still being encoded.
         
         Args:
-            audio_files (List[str]): List of audio file paths to transcribe
+            audio_files (Iterable[str]): Audio file paths, e.g. a generator fed by FFmpeg
             
         Returns:
             str: Complete merged transcript
@@ -182,28 +399,45 @@ class AIServices:
         """
         MessageSystem.log_progress(MessageCode.TRANSCRIPTION_START)
         
-        full_transcript = []
-        total_files = len(audio_files)
+        loop = self._get_loop()
+        queue = asyncio.Queue()
+        consumers = asyncio.run_coroutine_threadsafe(self._consume_transcription_queue(queue), loop)
+        try:
+            for index, file_path in enumerate(audio_files, 1):
+                loop.call_soon_threadsafe(queue.put_nowait, (index, file_path))
+                if consumers.done():
+                    break # A transcription already failed; stop producing
+        except BaseException:
+            consumers.cancel()
+            raise
+        finally:
+            if hasattr(audio_files, "close"):
+                audio_files.close()
+        
+        loop.call_soon_threadsafe(queue.put_nowait, None)
+        full_transcript = consumers.result()
         
-        for i, file_path in enumerate(audio_files, 1):
-            MessageSystem.log_progress(MessageCode.TRANSCRIPTION_CHUNK_PROGRESS,
-                                     current=i, total=total_files, filename=os.path.basename(file_path))
-            try:
-                with open(file_path, "rb") as audio_file:
-                    transcription = self.client.audio.transcriptions.create(
-                        model=config.WHISPER_MODEL,
-                        file=audio_file
-                    )
-                full_transcript.append(transcription.text.strip())
-                
-            except APIError as e:
-                raise TranscriptionError(f"OpenAI API error during transcription of {file_path}: {e}")
-            except Exception as e:
-                raise TranscriptionError(f"Unexpected error during transcription of {file_path}: {e}")
-
         MessageSystem.log_success(MessageCode.TRANSCRIPTION_SUCCESS)
         return "\n".join(full_transcript)
 
+    def _looks_english(self, sample: str) -> bool:
+        """
+        Cheaply recognise plainly English text so langdetect can be skipped.
+        
+        Near-pure ASCII alone would also match e.g. Indonesian or unaccented Spanish,
+        so the sample must additionally be dense in common English function words.
+        """
+        if not sample:
+            return False
+        ascii_ratio = sum(1 for c in sample if ord(c) < 128) / len(sample)
+        if ascii_ratio < config.ENGLISH_FAST_PATH_MIN_ASCII_RATIO:
+            return False
+        words = re.findall(r"[a-z']+", sample.lower())
+        if not words:
+            return False
+        stopword_ratio = sum(1 for w in words if w in ENGLISH_STOPWORDS) / len(words)
+        return stopword_ratio >= config.ENGLISH_FAST_PATH_MIN_STOPWORD_RATIO
+
     def detect_language(self, text: str) -> str:
         """
         Detect text language using local langdetect library.
@@ -222,6 +456,10 @@ class AIServices:
         try:
             # Use first 500 characters for faster and more accurate detection
             sample = text[:500]
+            if self._looks_english(sample):
+                MessageSystem.log_success(MessageCode.TEXT_LANGUAGE_DETECTED, language="en")
+                return "en"
+
             detected_lang = detect(sample)
             
             MessageSystem.log_success(MessageCode.TEXT_LANGUAGE_DETECTED, language=detected_lang)
@@ -230,9 +468,33 @@ class AIServices:
         except LangDetectException:
             raise LanguageDetectionError("Could not determine the language of the provided text.")
 
+    @retry_on_rate_limit
+    async def _translate_chunk(self, index: int, total_chunks: int, chunk: str) -> str:
+        """
+        Translate a single text chunk to English.
+        """
+        if total_chunks > 1:
+            MessageSystem.log_progress(MessageCode.TRANSCRIPTION_CHUNK_PROGRESS,
+                                     current=index, total=total_chunks, filename="translation chunk")
+        try:
+            response = await self.aclient.chat.completions.create(
+                model=config.TRANSLATION_MODEL,
+                messages=[
+                    {"role": "system", "content": config.TRANSLATION_PROMPT},
+                    {"role": "user", "content": chunk}
+                ],
+                # temperature=0.1
+            )
+            return response.choices[0].message.content.strip()
+            
+        except RateLimitError:
+            raise
+        except APIError as e:
+            raise ApiServiceError(f"API error during translation of chunk {index}: {e}")
+
     def translate_text(self, text_to_translate: str) -> str:
         """
-        Translate large text to English using GPT-5 mini with intelligent chunking.
+        Translate large text to English using GPT-5 mini, translating chunks concurrently.
         
         Args:
             text_to_translate (str): Text to translate to English
@@ -249,33 +511,63 @@ class AIServices:
         if not chunks:
             return ""
 
-        translated_chunks = []
-        total_chunks = len(chunks)
-        
-        for i, chunk in enumerate(chunks, 1):
-            if total_chunks > 1:
-                MessageSystem.log_progress(MessageCode.TRANSCRIPTION_CHUNK_PROGRESS,
-                                         current=i, total=total_chunks, filename="translation chunk")
-            try:
-                response = self.client.chat.completions.create(
-                    model=config.TRANSLATION_MODEL,
-                    messages=[
-                        {"role": "system", "content": config.TRANSLATION_PROMPT},
-                        {"role": "user", "content": chunk}
-                    ],
-                    # temperature=0.1
-                )
-                translated_chunks.append(response.choices[0].message.content.strip())
-                
-            except APIError as e:
-                raise ApiServiceError(f"API error during translation of chunk {i}: {e}")
+        # Chunks are independent, so translate them concurrently; gather preserves their order
+        translated_chunks = self._run_async(
+            self._map_concurrently(config.TRANSLATION_CONCURRENCY, self._translate_chunk, chunks)
+        )
         
         MessageSystem.log_success(MessageCode.TEXT_TRANSLATION_SUCCESS)
         return " ".join(translated_chunks)
 
+    @retry_on_rate_limit
+    async def _summarize_chunk(self, index: int, total_chunks: int, chunk: str) -> str:
+        """
+        Summarize a single transcript chunk.
+        """
+        MessageSystem.log_progress(MessageCode.AI_SUMMARIZATION_CHUNK, current=index, total=total_chunks)
+        
+        try:
+            response = await self.aclient.chat.completions.create(
+                model=config.SUMMARIZATION_MODEL,
+                messages=[
+                    {"role": "system", "content": config.SRS_COMPLIANT_PROMPT},
+                    {"role": "user", "content": f"{SUMMARY_CHUNK_INSTRUCTION}---\n{chunk}\n---"}
+                ]
+            )
+            return response.choices[0].message.content.strip()
+            
+        except RateLimitError:
+            raise
+        except APIError as e:
+            raise ApiServiceError(f"API error while summarizing chunk {index}: {e}")
+
+    def _drop_redundant_summaries(self, summaries: List[str]) -> List[str]:
+        """
+        Remove empty chunk summaries and ones that nearly repeat the previous kept summary
+        (e.g. a long stretch of the same slide or recording loop).
+        
+        Args:
+            summaries (List[str]): Chunk summaries in order
+            
+        Returns:
+            List[str]: The distinct summaries, in order; never empty if any input was
+        """
+        kept = []
+        for summary in summaries:
+            if not summary.strip():
+                continue
+            if kept:
+                matcher = difflib.SequenceMatcher(None, kept[-1], summary, autojunk=False)
+                # quick_ratio is a cheap upper bound; only compute the exact ratio when it could pass
+                if matcher.quick_ratio() >= config.SUMMARY_DUPLICATE_RATIO and matcher.ratio() >= config.SUMMARY_DUPLICATE_RATIO:
+                    continue
+            kept.append(summary)
+        return kept or summaries[:1]
+
     def summarize_text(self, text: str) -> str:
         """
         Generate comprehensive summary using hierarchical summarization with SRS compliance.
+        A summary generated earlier for the same transcript and model is reused from the cache.
         
         Args:
             text (str): Text to summarize
@@ -287,30 +579,51 @@ class AIServices:
             ApiServiceError: If summarization API calls fail
         """
         MessageSystem.log_progress(MessageCode.AI_SUMMARIZATION_START)
-        
+
+        cache_key = None
+        if self.cache_manager and text.strip():
+            cache_key = self._summary_cache_key(text)
+            cached_summary = self.cache_manager.get_summary(cache_key)
+            if cached_summary:
+                MessageSystem.log_success(MessageCode.AI_SUMMARIZATION_SUCCESS)
+                return cached_summary
+
+        summary = self._generate_summary(text)
+        if cache_key:
+            self.cache_manager.set_summary(cache_key, summary)
+        return summary
+
+    def _summary_cache_key(self, text: str) -> str:
+        """
+        Build the summary cache key from everything that shapes the report: the model, every
+        summarization prompt and the transcript. Editing a prompt therefore never serves stale reports.
+        """
+        digest = hashlib.sha256()
+        for part in (config.SUMMARIZATION_MODEL, config.SRS_COMPLIANT_PROMPT, SUMMARY_CHUNK_INSTRUCTION,
+                     SUMMARY_MERGE_INSTRUCTION, SUMMARY_PART_SEPARATOR, text):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0") # Keep part boundaries unambiguous
+        return digest.hexdigest()
+
+    def _generate_summary(self, text: str) -> str:
+        """
+        Summarize each chunk concurrently, then merge the chunk summaries into one report.
+        """
         chunks = self.internal_text_processor.split_into_chunks(text)
         if not chunks:
             return "Could not generate a summary because the input text was empty after cleaning."
 
-        summaries = []
-        total_chunks = len(chunks)
-        
-        # Summarize each chunk individually
-        for i, chunk in enumerate(chunks, 1):
-            MessageSystem.log_progress(MessageCode.AI_SUMMARIZATION_CHUNK, current=i, total=total_chunks)
-            
-            try:
-                response = self.client.chat.completions.create(
-                    model=config.SUMMARIZATION_MODEL,
-                    messages=[
-                        {"role": "system", "content": config.SRS_COMPLIANT_PROMPT},
-                        {"role": "user", "content": f"Please summarize this chunk of the meeting transcript:\n\n---\n{chunk}\n---"}
-                    ]
-                )
-                summaries.append(response.choices[0].message.content.strip())
-                
-            except APIError as e:
-                raise ApiServiceError(f"API error while summarizing chunk {i}: {e}")
+        # Summarize each chunk individually and concurrently (map step).
+        # Every chunk is attempted so a failure reports all failing chunks at once.
+        summaries = self._run_async(
+            self._map_concurrently(config.SUMMARIZATION_CONCURRENCY, self._summarize_chunk, chunks, return_exceptions=True)
+        )
+        failures = [f"chunk {i}: {result}" for i, result in enumerate(summaries, 1) if isinstance(result, BaseException)]
+        if failures:
+            raise ApiServiceError(f"Summarization failed for {len(failures)} of {len(chunks)} chunks ({'; '.join(failures)})")
+
+        # Empty and repeated parts add nothing to the merge; if only one part remains, no merge call is needed
+        summaries = self._drop_redundant_summaries(summaries)
 
         # Return single summary if only one chunk
         if len(summaries) == 1:
@@ -320,19 +633,21 @@ class AIServices:
         # Merge multiple summaries into final coherent report
         MessageSystem.log_progress(MessageCode.AI_SUMMARIZATION_MERGE)
         
-        merged_summaries = "\n\n---\n[End of Part]\n---\n\n".join(summaries)
+        # Collect every piece of the prompt and join once, so the (possibly very large)
+        # summaries are copied a single time instead of into an intermediate string first
+        prompt_parts = [SUMMARY_MERGE_INSTRUCTION, "---\n", summaries[0]]
+        for summary in summaries[1:]:
+            prompt_parts.append(SUMMARY_PART_SEPARATOR)
+            prompt_parts.append(summary)
+        prompt_parts.append("\n---")
+        merge_prompt = "".join(prompt_parts)
 
         try:
             final_response = self.client.chat.completions.create(
-                model=config.CHAT_MODEL,
+                model=config.SUMMARIZATION_MODEL,
                 messages=[
                     {"role": "system", "content": config.SRS_COMPLIANT_PROMPT},
-                    {"role": "user", "content": (
-                        "You have been provided with summaries from different parts of a single meeting. "
-                        "Synthesize them into one final, cohesive summary that follows all required output sections "
-                        "(Abstract Summary, Key Points, etc.). Ensure the final output is a single, unified document.\n\n"
-                        f"---\n{merged_summaries}\n---"
-                    )}
+                    {"role": "user", "content": merge_prompt}
                 ]
             )
             
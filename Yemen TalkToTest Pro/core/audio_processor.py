@@ -4,13 +4,15 @@ Handles audio downloading, conversion, cleaning, and chunking operations.
 """
 
 import os
-import re
 import subprocess
 import uuid
-import json
+import threading
+from collections import deque
 from math import ceil
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+from yt_dlp import YoutubeDL
+from yt_dlp.utils import DownloadError
 
 from utils.custom_exceptions import FileSystemError, FFmpegError
 from core.message_system import MessageSystem, MessageCode
@@ -40,11 +42,12 @@ class AudioProcessor:
         Fetch metadata from URL without downloading full content using yt-dlp.
         """
         MessageSystem.log_progress(MessageCode.AUDIO_METADATA_FETCH_START, url=url)
-        command = ['python', '-m', 'yt_dlp', '--skip-download', '--dump-json', '--no-playlist', url]
+        # yt-dlp runs in-process, avoiding a new interpreter and a JSON round-trip per call
+        options = {'skip_download': True, 'noplaylist': True, 'quiet': True, 'no_warnings': True}
         try:
-            result = subprocess.run(command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding='utf-8')
-            return json.loads(result.stdout)
-        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
+            with YoutubeDL(options) as ydl:
+                return ydl.sanitize_info(ydl.extract_info(url, download=False)) or {}
+        except DownloadError as e:
             MessageSystem.log_warning(MessageCode.AUDIO_METADATA_FETCH_FAILED, details=str(e))
             return {}
 
@@ -54,43 +57,46 @@ class AudioProcessor:
         """
         MessageSystem.log_progress(MessageCode.AUDIO_DOWNLOAD_START, url=url)
         unique_id = uuid.uuid4()
-        output_template = os.path.join(output_dir, f"downloaded_{unique_id}.%(ext)s")
         
-        # CRITICAL: Force all yt-dlp files (temp, cache, output) into the job's temp directory
-        command = [
-            'python', '-m', 'yt_dlp',
-            '--ffmpeg-location', self.ffmpeg_path,
-            '--paths', output_dir, 
-            '-f', 'bestaudio/best',
-            '-x', '--audio-format', 'mp3',
-            '--no-playlist',
-            '-o', output_template,
-            url
-        ]
+        # CRITICAL: Force all yt-dlp files (temp, output) into the job's temp directory
+        options = {
+            'ffmpeg_location': self.ffmpeg_path,
+            'paths': {'home': output_dir, 'temp': output_dir},
+            'outtmpl': f"downloaded_{unique_id}.%(ext)s",
+            'format': 'bestaudio/best',
+            'postprocessors': [{'key': 'FFmpegExtractAudio', 'preferredcodec': 'mp3'}],
+            'noplaylist': True,
+            'quiet': True,
+            'noprogress': True,
+            'no_warnings': True
+        }
         
         try:
-            self._run_command(command, "Audio download failed")
-        except FFmpegError as e:
+            with YoutubeDL(options) as ydl:
+                ydl.download([url])
+        except DownloadError as e:
             raise FFmpegError(f"Download failed for URL. Error: {e}")
         
         # Find the downloaded file, as the extension might not be '.mp3'
-        for f in os.listdir(output_dir):
-            if f.startswith(f"downloaded_{unique_id}"):
-                downloaded_path = os.path.join(output_dir, f)
-                MessageSystem.log_success(MessageCode.AUDIO_DOWNLOAD_SUCCESS, path=downloaded_path)
-                return downloaded_path
+        for match in Path(output_dir).glob(f"downloaded_{unique_id}.*"):
+            downloaded_path = str(match)
+            MessageSystem.log_success(MessageCode.AUDIO_DOWNLOAD_SUCCESS, path=downloaded_path)
+            return downloaded_path
                 
         raise FileSystemError("Audio file was not found after download process")
 
     def _run_command(self, command: List[str], error_message: str):
         """
         Execute system command with proper error handling.
+        stdout is discarded and stderr is streamed through a bounded buffer, so memory stays
+        flat however much progress output a long FFmpeg run prints; only its tail is reported.
         """
         try:
-            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding='utf-8')
-            stdout, stderr = process.communicate()
+            with subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                  text=True, encoding='utf-8', errors='replace') as process:
+                stderr_tail = deque(process.stderr, maxlen=config.FFMPEG_STDERR_TAIL_LINES)
             if process.returncode != 0:
-                raise FFmpegError(f"{error_message}: {stderr}")
+                raise FFmpegError(f"{error_message}: {''.join(stderr_tail)}")
         except FileNotFoundError:
             raise FFmpegError(f"Command '{command[0]}' was not found. Please check installation.")
         
@@ -123,60 +129,72 @@ class AudioProcessor:
         self._run_command(command, "Failed to extract initial audio segment")
         return output_path
 
-    def convert_to_standard_mp3(self, input_path: str, output_path: str) -> str:
-        # ... (this function remains the same) ...
+    def convert_clean_and_chunk(self, input_path: str, output_dir: str) -> Iterator[str]:
+        """
+        Standardize, enhance, clean and split audio in a single FFmpeg run with one MP3 encode,
+        yielding each chunk path as soon as FFmpeg has finished writing it, so transcription can
+        start while later chunks are produced. No intermediate full-length files are written.
+        
+        The audio stays in one chunk when its estimated encoded size (duration x bitrate) fits the
+        upload limit; otherwise it is split into the fewest equal-length chunks that do.
+        FFmpeg reports completed segments through its segment list, written to stdout, while a
+        helper thread drains stderr into a bounded tail so a flood of decode errors cannot fill
+        the pipe and stall FFmpeg. Closing the generator early stops FFmpeg.
+        """
         if not os.path.exists(input_path):
             raise FileSystemError(f"Input file not found: {input_path}")
-        MessageSystem.log_progress(MessageCode.AUDIO_CONVERSION_START, method="standardization")
+        MessageSystem.log_progress(MessageCode.AUDIO_CONVERSION_START, method="standardization + cleaning")
+        os.makedirs(output_dir, exist_ok=True)
+        
+        duration = self._get_duration_seconds(input_path)
+        estimated_size = duration * int(self.bitrate.rstrip("k")) * 1000 / 8
+        num_parts = max(1, ceil(estimated_size / self.max_size_bytes))
+        # Cut only between parts: a cut at the very end would turn the encoder's trailing padding into
+        # a sliver chunk, so a single part gets one cut point past the end instead
+        cut_points = [duration * part / num_parts for part in range(1, num_parts)] or [duration + 1]
+        
         command = [
-            self.ffmpeg_path, "-y", "-i", input_path,
-            "-vn", "-acodec", "libmp3lame",
-            "-ac", str(config.AUDIO_CHANNELS), 
+            self.ffmpeg_path, "-y", "-nostdin", "-v", "error", "-i", input_path,
+            "-vn", "-af", ",".join(config.AUDIO_ENHANCE_FILTERS + config.AUDIO_CLEANING_FILTERS),
+            "-acodec", "libmp3lame",
+            "-ac", str(config.AUDIO_CHANNELS),
             "-ar", str(config.AUDIO_SAMPLE_RATE),
             "-b:a", self.bitrate,
+            "-f", "segment", "-segment_times", ",".join(f"{point:.3f}" for point in cut_points),
+            "-reset_timestamps", "1",
+            "-segment_list", "pipe:1", "-segment_list_type", "flat",
+            os.path.join(output_dir, "part_%03d.mp3")
         ]
-        if config.AUDIO_ENHANCE_FILTERS:
-            command.extend(["-af", ",".join(config.AUDIO_ENHANCE_FILTERS)])
-        command.append(output_path)
-        self._run_command(command, "Audio conversion failed")
-        MessageSystem.log_success(MessageCode.AUDIO_STANDARDIZATION_SUCCESS, path=output_path)
-        return output_path
-    
-    def clean_audio(self, input_path: str, output_path: str) -> str:
-        # ... (this function remains the same) ...
-        MessageSystem.log_progress(MessageCode.AUDIO_CONVERSION_START, method="cleaning")
-        command = [
-            self.ffmpeg_path, "-y", "-i", input_path,
-            "-af", ",".join(config.AUDIO_CLEANING_FILTERS),
-            output_path
-        ]
-        self._run_command(command, "Audio cleaning failed")
-        MessageSystem.log_success(MessageCode.AUDIO_CLEANING_SUCCESS, path=output_path)
-        return output_path
-
-    def chunk_audio(self, input_path: str, output_dir: str = "chunks") -> List[str]:
-        # ... (this function remains the same) ...
-        file_size = os.path.getsize(input_path)
-        if file_size <= self.max_size_bytes:
-            return [input_path]
-        
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        try:
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                       text=True, encoding='utf-8', errors='replace')
+        except FileNotFoundError:
+            raise FFmpegError(f"Command '{command[0]}' was not found. Please check installation.")
         
-        num_parts = ceil(file_size / self.max_size_bytes)
-        duration = self._get_duration_seconds(input_path)
-        segment_time = duration / num_parts
+        stderr_tail = deque(maxlen=config.FFMPEG_STDERR_TAIL_LINES)
+        stderr_reader = threading.Thread(target=stderr_tail.extend, args=(process.stderr,), daemon=True)
+        stderr_reader.start()
         
-        output_pattern = os.path.join(output_dir, "part_%03d.mp3")
-        command = [
-            self.ffmpeg_path, "-y", "-i", input_path,
-            "-f", "segment", "-segment_time", str(segment_time),
-            "-c", "copy", output_pattern
-        ]
-        self._run_command(command, "Audio chunking failed")
+        chunk_count = 0
+        try:
+            for line in process.stdout:
+                segment_name = line.strip()
+                if segment_name:
+                    chunk_count += 1
+                    yield os.path.join(output_dir, os.path.basename(segment_name))
+            
+            returncode = process.wait()
+            stderr_reader.join()
+            if returncode != 0:
+                raise FFmpegError(f"Audio cleaning failed: {''.join(stderr_tail)}")
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            stderr_reader.join()
+            process.stdout.close()
+            process.stderr.close()
         
-        output_files = sorted([os.path.join(output_dir, f) for f in os.listdir(output_dir) if f.startswith("part_")])
-        if not output_files:
+        if chunk_count == 0:
             raise FFmpegError("No audio chunks were created during splitting process")
-            
-        return output_files
\ No newline at end of file
+        MessageSystem.log_success(MessageCode.AUDIO_CHUNKING_SUCCESS, count=chunk_count)
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Cache Management Module for TalkToText Pro-v1.0 Engine
+Handles Redis operations for shared, short-lived state such as job status and AI decisions.
+"""
+
+import json
+from typing import Any, Dict, Optional
+import redis
+
+from utils.custom_exceptions import ProjectBaseException
+from core.message_system import MessageSystem, MessageCode
+import config
+
+class CacheManager:
+    """
+    Handles all interactions with Redis so state is shared across web and worker processes.
+    """
+
+    JOB_KEY_PREFIX = "job:"
+    CLASSIFICATION_KEY_PREFIX = "cls:"
+    SUMMARY_KEY_PREFIX = "sum:"
+
+    def __init__(self, redis_url: str):
+        """
+        Initialize Redis connection.
+        """
+        try:
+            self.client = redis.Redis.from_url(redis_url)
+            self.client.ping()
+
+            MessageSystem.log_success(MessageCode.CACHE_CONNECTION_SUCCESS)
+
+        except redis.exceptions.ConnectionError as e:
+            MessageSystem.log_error(MessageCode.CACHE_CONNECTION_FAILED, details=str(e))
+            raise ProjectBaseException(f"Could not connect to Redis: {e}")
+
+    def set_job_state(self, job_id: str, state: Dict[str, Any], ttl_seconds: int = config.JOB_STATE_TTL_SECONDS):
+        """
+        Store the current state of a background job and publish it to the job's channel.
+        Redis evicts the stored state after the TTL.
+        """
+        key = f"{self.JOB_KEY_PREFIX}{job_id}"
+        payload = json.dumps(state)
+        pipe = self.client.pipeline()
+        pipe.setex(key, ttl_seconds, payload)
+        pipe.publish(key, payload)
+        pipe.execute()
+
+    def subscribe_job_state(self, job_id: str) -> redis.client.PubSub:
+        """
+        Subscribe to state changes of a background job. The caller must close the returned PubSub.
+        """
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(f"{self.JOB_KEY_PREFIX}{job_id}")
+        return pubsub
+
+    def get_job_state(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the state of a background job, or None if it is unknown or expired.
+        """
+        raw = self.client.get(f"{self.JOB_KEY_PREFIX}{job_id}")
+        return json.loads(raw) if raw else None
+
+    def set_classification(self, key: str, decision: str, ttl_seconds: int = config.CLASSIFICATION_CACHE_TTL_SECONDS):
+        """
+        Cache an AI classification decision under a content-derived key.
+        """
+        self.client.setex(f"{self.CLASSIFICATION_KEY_PREFIX}{key}", ttl_seconds, decision)
+
+    def get_classification(self, key: str) -> Optional[str]:
+        """
+        Retrieve a cached AI classification decision, or None on a cache miss.
+        """
+        raw = self.client.get(f"{self.CLASSIFICATION_KEY_PREFIX}{key}")
+        return raw.decode("utf-8") if raw else None
+
+    def set_summary(self, key: str, summary: str, ttl_seconds: int = config.SUMMARY_CACHE_TTL_SECONDS):
+        """
+        Cache a generated summary under a content-derived key.
+        """
+        self.client.setex(f"{self.SUMMARY_KEY_PREFIX}{key}", ttl_seconds, summary.encode("utf-8"))
+
+    def get_summary(self, key: str) -> Optional[str]:
+        """
+        Retrieve a cached summary, or None on a cache miss.
+        """
+        raw = self.client.get(f"{self.SUMMARY_KEY_PREFIX}{key}")
+        return raw.decode("utf-8") if raw else None
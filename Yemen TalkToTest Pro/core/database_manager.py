@@ -4,13 +4,17 @@ Handles all MongoDB database operations including user management and job tracki
 """
 
 import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import bcrypt
-from pymongo import MongoClient, errors, ReturnDocument
+from pymongo import MongoClient, UpdateOne, errors, ReturnDocument
 from bson.objectid import ObjectId
 
 from utils.custom_exceptions import ProjectBaseException
 from core.message_system import MessageSystem, MessageCode
+import config
+
+# One pooled MongoClient per connection string, shared by every DatabaseManager in the process
+_CLIENT_CACHE: Dict[str, MongoClient] = {}
 
 class DatabaseManager:
     """
@@ -21,28 +25,74 @@ class DatabaseManager:
         """
         Initialize database connection and setup collections.
         """
+        self.connection_string = connection_string
+        self.db_name = db_name
+        # Job event log entries waiting to be written, keyed by job id (see add_log_entry)
+        self._pending_events: Dict[ObjectId, List[Dict[str, Any]]] = {}
         try:
-            self.client = MongoClient(connection_string)
-            self.client.admin.command('ismaster')
-            
-            self.db = self.client[db_name]
-            self.users = self.db.users
-            self.jobs = self.db.jobs
-            
-            self.users.create_index("email", unique=True)
+            first_init = connection_string not in _CLIENT_CACHE
+            self._connect()
             
-            MessageSystem.log_success(MessageCode.DB_CONNECTION_SUCCESS)
+            # Connectivity check and index setup only need to run once per process
+            if first_init:
+                self.client.admin.command('ismaster')
+                
+                self.users.create_index("email", unique=True)
+                # Serves get_user_jobs (filter + sort) and soft_delete_all_user_jobs without a sort stage
+                self.jobs.create_index([("userId", 1), ("visibility", 1), ("createdAt", -1)], name="jobs_user_visible_recent")
+                # Serves find_job_by_hash; only uploads carry a content hash, so other jobs stay out of it
+                self.jobs.create_index(
+                    [("userId", 1), ("source.contentHash", 1)],
+                    name="jobs_user_content_hash",
+                    partialFilterExpression={"source.contentHash": {"$exists": True}}
+                )
+                
+                MessageSystem.log_success(MessageCode.DB_CONNECTION_SUCCESS)
             
         except errors.ConnectionFailure as e:
+            _CLIENT_CACHE.pop(connection_string, None) # Let the next attempt connect and check again
             MessageSystem.log_error(MessageCode.DB_CONNECTION_FAILED, details=str(e))
             raise ProjectBaseException(f"Could not connect to MongoDB: {e}")
 
+    def _connect(self, fresh: bool = False):
+        """
+        Bind the shared pooled MongoClient for this connection string (creating it if needed,
+        or always when fresh=True) and the collection handles.
+        connect=False defers opening sockets until the first operation.
+        """
+        client = None if fresh else _CLIENT_CACHE.get(self.connection_string)
+        if client is None:
+            client = MongoClient(
+                self.connection_string,
+                maxPoolSize=config.MONGO_MAX_POOL_SIZE,
+                minPoolSize=config.MONGO_MIN_POOL_SIZE,
+                waitQueueTimeoutMS=config.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+                serverSelectionTimeoutMS=config.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+                retryWrites=True,
+                w=config.MONGO_WRITE_CONCERN_W,
+                appname=config.MONGO_APP_NAME,
+                connect=False
+            )
+            _CLIENT_CACHE[self.connection_string] = client
+        self.client = client
+        self.db = self.client[self.db_name]
+        self.users = self.db.users
+        self.jobs = self.db.jobs
+
+    def reset_client(self):
+        """
+        Re-create the client and its connection pool.
+        MongoClient is not fork-safe, so each forked worker process must call this.
+        The inherited client in the shared cache is replaced as well.
+        """
+        self._connect(fresh=True)
+
     def create_user(self, first_name: str, last_name: str, email: str, plain_text_password: str, profile_picture_url: str = None) -> ObjectId:
         """
         Create new user or return existing user ID if email already exists.
         """
         try:
-            hashed_password = bcrypt.hashpw(plain_text_password.encode('utf-8'), bcrypt.gensalt())
+            hashed_password = self._hash_password(plain_text_password)
             
             user_doc = {
                 "firstName": first_name,
@@ -58,21 +108,34 @@ class DatabaseManager:
             return user_id
             
         except errors.DuplicateKeyError:
-            existing_user = self.get_user_by_email(email)
+            existing_user = self._get_user_id_by_email(email)
             if existing_user:
                 MessageSystem.log_info(MessageCode.DB_USER_EXISTS, user_id=existing_user.get('_id'))
                 return existing_user.get('_id')
             raise
 
+    def _hash_password(self, plain_text_password: str) -> bytes:
+        """
+        Hash a password with bcrypt at the configured cost factor.
+        """
+        return bcrypt.hashpw(plain_text_password.encode('utf-8'), bcrypt.gensalt(rounds=config.BCRYPT_ROUNDS))
+
+    def _get_user_id_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """
+        Existence check by email: returns only {'_id': ...}, or None if no such user.
+        """
+        return self.users.find_one({"email": email.lower()}, {"_id": 1})
+
     def get_user_by_email(self, email: str) -> Dict[str, Any]:
         """
         Retrieve user document by email address.
         """
         return self.users.find_one({"email": email.lower()})
 
-    def create_job(self, user_id: ObjectId, source_type: str, source_value: str) -> ObjectId:
+    def create_job(self, user_id: ObjectId, source_type: str, source_value: str, content_hash: str = None) -> ObjectId:
         """
         Create new processing job for a user with 'visible' status.
+        For uploaded files, content_hash is the SHA-256 of the upload and enables deduplication.
         """
         current_time = datetime.datetime.now(datetime.timezone.utc)
         
@@ -88,15 +151,44 @@ class DatabaseManager:
             "eventLog": []
         }
         
+        if content_hash:
+            job_doc["source"]["contentHash"] = content_hash
+        
         job_id = self.jobs.insert_one(job_doc).inserted_id
         MessageSystem.log_success(MessageCode.DB_JOB_CREATED, job_id=job_id)
         return job_id
 
-    def get_user_jobs(self, user_id: ObjectId) -> List[Dict[str, Any]]:
+    def find_job_by_hash(self, content_hash: str, user_id: ObjectId, quality_preset: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the user's most recent visible, completed job for an upload with the given SHA-256
+        that was processed at the same audio quality preset.
+        Returns None if this content has not been processed before at that quality.
+        """
+        return self.jobs.find_one(
+            {
+                "userId": user_id,
+                "source.contentHash": content_hash,
+                "processing.audio.qualityPreset": quality_preset,
+                "status": "completed",
+                "visibility": "visible"
+            },
+            {"processing": 1},
+            sort=[("createdAt", -1)]
+        )
+
+    # Fields the history view never reads; excluding them keeps large payloads off the wire
+    HISTORY_EXCLUDED_FIELDS = {"eventLog": 0, "processing.language.finalTranscript": 0}
+
+    def get_user_jobs(self, user_id: ObjectId, page: int = 1, page_size: int = config.HISTORY_PAGE_SIZE) -> List[Dict[str, Any]]:
         """
-        Retrieve all VISIBLE jobs for a specific user, sorted by most recent.
+        Retrieve one page of VISIBLE jobs for a specific user, sorted by most recent.
         """
-        return list(self.jobs.find({"userId": user_id, "visibility": "visible"}).sort("createdAt", -1))
+        skip = (max(page, 1) - 1) * page_size
+        cursor = self.jobs.find(
+            {"userId": user_id, "visibility": "visible"},
+            self.HISTORY_EXCLUDED_FIELDS
+        ).sort("createdAt", -1).skip(skip).limit(page_size)
+        return list(cursor)
 
     # --- START: SOFT DELETE METHODS ---
     def soft_delete_job(self, job_id: ObjectId, user_id: ObjectId) -> bool:
@@ -126,6 +218,8 @@ class DatabaseManager:
                         start_time: datetime.datetime, end_time: datetime.datetime, message: str = ""):
         """
         Add detailed, timed event entry to job's execution log.
+        The entry is buffered and written together with the job's next update (or flush_events),
+        so logging a step costs no extra round-trip.
         """
         duration = round((end_time - start_time).total_seconds(), 2)
         
@@ -139,18 +233,41 @@ class DatabaseManager:
             "message": message
         }
         
-        self.jobs.update_one(
-            {"_id": job_id}, 
-            {"$push": {"eventLog": event}}
-        )
+        self._pending_events.setdefault(job_id, []).append(event)
+
+    def _attach_pending_events(self, job_id: ObjectId, update_doc: dict) -> dict:
+        """
+        Add the job's buffered event log entries to an update document.
+        """
+        events = self._pending_events.pop(job_id, None)
+        if events:
+            update_doc["$push"] = {"eventLog": {"$each": events}}
+        return update_doc
+
+    def flush_events(self, job_id: ObjectId = None):
+        """
+        Write buffered event log entries for one job, or for all jobs, in a single bulk write.
+        """
+        job_ids = [job_id] if job_id is not None else list(self._pending_events)
+        operations = []
+        for pending_job_id in job_ids:
+            events = self._pending_events.pop(pending_job_id, None)
+            if events:
+                operations.append(UpdateOne({"_id": pending_job_id}, {"$push": {"eventLog": {"$each": events}}}))
+        if operations:
+            self.jobs.bulk_write(operations, ordered=False)
         
-    def update_job_processing_data(self, job_id: ObjectId, field_to_update: dict):
+    def update_job_processing_data(self, job_id: ObjectId, field_to_update: dict, attach_events: bool = True):
         """
         Updates a specific field within the 'processing' sub-document of a job.
+        Writes made off the pipeline thread pass attach_events=False, so buffered events stay
+        in order and are never lost with a failed background write.
         """
         update_doc = {
             "$set": {f"processing.{key}": value for key, value in field_to_update.items()}
         }
+        if attach_events:
+            update_doc = self._attach_pending_events(job_id, update_doc)
         self.jobs.update_one({"_id": job_id}, update_doc)
         
     def update_job_status(self, job_id: ObjectId, new_status: str, error_stage: str = None, error_message: str = None):
@@ -170,37 +287,39 @@ class DatabaseManager:
                 "message": error_message
             }
         
-        self.jobs.update_one({"_id": job_id}, update_doc)
+        self.jobs.update_one({"_id": job_id}, self._attach_pending_events(job_id, update_doc))
         MessageSystem.log_success(MessageCode.DB_JOB_UPDATED, job_id=job_id, status=new_status.upper())
 
-    def _deep_merge_dicts(self, base: dict, new: dict) -> dict:
+    def _flatten_to_dot_paths(self, data: dict, prefix: str) -> Dict[str, Any]:
         """
-        Recursively merge two dicts.
+        Map the leaves of a nested dict to their dot paths under prefix.
+        Setting these paths deep-merges data into the stored document without reading it first.
+        Walks the dict with an explicit stack: no recursion and no intermediate dicts per level.
         """
-        merged = dict(base)
-        for k, v in new.items():
-            if k in merged and isinstance(merged[k], dict) and isinstance(v, dict):
-                merged[k] = self._deep_merge_dicts(merged[k], v)
-            else:
-                merged[k] = v
-        return merged
+        flat = {}
+        stack = [(prefix, data)]
+        while stack:
+            path_prefix, current = stack.pop()
+            for key, value in current.items():
+                path = f"{path_prefix}.{key}"
+                if isinstance(value, dict) and value:
+                    stack.append((path, value))
+                else:
+                    flat[path] = value
+        return flat
 
     def save_job_results(self, job_id: ObjectId, processing_data: dict):
         """
         Save final processing results to job document.
+        Results are merged into the existing 'processing' sub-document in one atomic update.
         """
-        existing_doc = self.jobs.find_one({"_id": job_id}, {"processing": 1}) or {}
-        existing_processing = existing_doc.get("processing", {}) or {}
-
-        merged_processing = self._deep_merge_dicts(existing_processing, processing_data)
-
         update_doc = {
             "$set": {
-                "processing": merged_processing,
+                **self._flatten_to_dot_paths(processing_data, "processing"),
                 "status": "completed",
                 "updatedAt": datetime.datetime.now(datetime.timezone.utc)
             }
         }
 
-        self.jobs.update_one({"_id": job_id}, update_doc)
+        self.jobs.update_one({"_id": job_id}, self._attach_pending_events(job_id, update_doc))
         MessageSystem.log_success(MessageCode.DB_RESULTS_SAVED, job_id=job_id)
\ No newline at end of file
@@ -3,6 +3,9 @@ Professional Message System for TalkToText Pro-v1.0 Engine
 Provides centralized message management with standardized status codes and responses.
 """
 
+import os
+import sys
+import time
 from enum import Enum
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
@@ -27,6 +30,10 @@ class MessageCode(Enum):
     DB_JOB_UPDATED = 1005
     DB_RESULTS_SAVED = 1006
     
+    # Cache Operations (1100-1199)
+    CACHE_CONNECTION_SUCCESS = 1100
+    CACHE_CONNECTION_FAILED = 1101
+    
     # Audio Processing (2000-2099)
     AUDIO_DOWNLOAD_START = 2001
     AUDIO_DOWNLOAD_SUCCESS = 2002
@@ -72,6 +79,7 @@ class MessageCode(Enum):
     PIPELINE_CLEANUP = 6001
     PIPELINE_SUCCESS = 6002
     PIPELINE_USER_INPUT = 6003
+    PIPELINE_DUPLICATE_UPLOAD = 6004
     
     # General Operations (9000-9099)
     OPERATION_FAILED = 9000
@@ -114,9 +122,44 @@ class Message:
         emoji = emoji_map.get(self.type, "📝")
         return f"{emoji} {self.message}"
 
+def _infer_message_type(code: MessageCode) -> MessageType:
+    """Naming rules that derive a code's default message type; evaluated once per code at import."""
+    if code.value < 2000:  # Database and cache operations (1000-1199)
+        return MessageType.SUCCESS if "SUCCESS" in code.name else MessageType.ERROR
+    elif "FAILED" in code.name or "ERROR" in code.name:
+        return MessageType.ERROR
+    elif "WARNING" in code.name:
+        return MessageType.WARNING
+    elif "START" in code.name or "PROGRESS" in code.name:
+        return MessageType.PROGRESS
+    return MessageType.SUCCESS
+
+class _TemplateArgs(dict):
+    """Template arguments for str.format_map; placeholders without a value are left as-is."""
+    def __missing__(self, key):
+        return "{" + key + "}"
+
 class MessageSystem:
     """Centralized message management system."""
     
+    # Console verbosity: messages below MIN_LEVEL are dropped before they are formatted.
+    # Set with the LOG_LEVEL environment variable (progress, info, success, warning, error).
+    LEVELS = {
+        MessageType.PROGRESS: 10,
+        MessageType.INFO: 20,
+        MessageType.SUCCESS: 25,
+        MessageType.WARNING: 30,
+        MessageType.ERROR: 40
+    }
+    MIN_LEVEL = LEVELS.get(MessageType.__members__.get(os.getenv("LOG_LEVEL", "progress").upper()), 10)
+    
+    # Default message type per code, precomputed so logging does not re-scan code names
+    DEFAULT_TYPES = {code: _infer_message_type(code) for code in MessageCode}
+    
+    # Inline (carriage-return) updates are flushed to the console at most this often
+    PROGRESS_FLUSH_SECONDS = 0.1
+    _last_inline_flush = 0.0
+    
     # Pre-defined message templates
     MESSAGES = {
         # Database Messages
@@ -128,6 +171,10 @@ class MessageSystem:
         MessageCode.DB_JOB_UPDATED: "Job {job_id} status updated to: {status}",
         MessageCode.DB_RESULTS_SAVED: "Job {job_id} results saved successfully to database.",
         
+        # Cache Messages
+        MessageCode.CACHE_CONNECTION_SUCCESS: "Redis cache connection established successfully.",
+        MessageCode.CACHE_CONNECTION_FAILED: "Failed to connect to Redis cache.",
+        
         # Audio Processing Messages
         MessageCode.AUDIO_DOWNLOAD_START: "Starting audio download from URL: {url}",
         MessageCode.AUDIO_DOWNLOAD_SUCCESS: "Audio downloaded and saved to: {path}",
@@ -173,6 +220,7 @@ class MessageSystem:
         MessageCode.PIPELINE_CLEANUP: "Cleaned up temporary directory: {temp_dir}",
         MessageCode.PIPELINE_SUCCESS: "Pipeline completed successfully! All results saved to database.",
         MessageCode.PIPELINE_USER_INPUT: "Summary generated. Translation options available.",
+        MessageCode.PIPELINE_DUPLICATE_UPLOAD: "Upload matches completed Job ID: {job_id}. Reusing its results.",
         
         # General Messages
         MessageCode.OPERATION_FAILED: "Operation failed: {error}",
@@ -180,6 +228,11 @@ class MessageSystem:
         MessageCode.UNEXPECTED_ERROR: "An unexpected error occurred: {error}"
     }
     
+    @classmethod
+    def default_type(cls, code: MessageCode) -> MessageType:
+        """Message type used for a code when the caller does not specify one."""
+        return cls.DEFAULT_TYPES[code]
+
     @classmethod
     def create_message(cls, 
                         code: MessageCode, 
@@ -189,20 +242,11 @@ class MessageSystem:
         
         # Auto-determine message type based on code if not provided
         if message_type is None:
-            if code.value < 2000:  # Database operations
-                message_type = MessageType.SUCCESS if "SUCCESS" in code.name else MessageType.ERROR
-            elif "FAILED" in code.name or "ERROR" in code.name:
-                message_type = MessageType.ERROR
-            elif "WARNING" in code.name:
-                message_type = MessageType.WARNING
-            elif "START" in code.name or "PROGRESS" in code.name:
-                message_type = MessageType.PROGRESS
-            else:
-                message_type = MessageType.SUCCESS
+            message_type = cls.default_type(code)
         
-        # Get message template and format it
+        # Get message template and format it; format_map reads kwargs directly instead of re-unpacking them
         message_template = cls.MESSAGES.get(code, f"Message code {code.value}: No template defined")
-        formatted_message = message_template.format(**kwargs) if kwargs else message_template
+        formatted_message = message_template.format_map(_TemplateArgs(kwargs))
         
         return Message(
             type=message_type,
@@ -212,40 +256,51 @@ class MessageSystem:
         )
     
     @classmethod
-    def log_message(cls, code: MessageCode, print_output: bool = True, inline: bool = False, **kwargs) -> Message:
-        """Create and optionally print a message to console."""
+    def log_message(cls, code: MessageCode, print_output: bool = True, inline: bool = False, **kwargs) -> Optional[Message]:
+        """
+        Create and optionally print a message to console.
+        Returns None without formatting anything if the message is below MIN_LEVEL.
+        """
+        message_type = kwargs.get('message_type') or cls.default_type(code)
+        if cls.LEVELS[message_type] < cls.MIN_LEVEL:
+            return None
+        
         message = cls.create_message(code, **kwargs)
         
         if print_output:
             formatted_output = message.format_console_output()
             if inline:
-                print(f"\r{formatted_output}", end="", flush=True)
+                sys.stdout.write(f"\r{formatted_output}")
+                now = time.monotonic()
+                if now - cls._last_inline_flush >= cls.PROGRESS_FLUSH_SECONDS:
+                    sys.stdout.flush()
+                    cls._last_inline_flush = now
             else:
-                print(formatted_output)
+                sys.stdout.write(formatted_output + "\n")
 
         return message
     
     @classmethod
-    def log_success(cls, code: MessageCode, **kwargs) -> Message:
+    def log_success(cls, code: MessageCode, **kwargs) -> Optional[Message]:
         """Log a success message."""
         return cls.log_message(code, message_type=MessageType.SUCCESS, **kwargs)
     
     @classmethod
-    def log_error(cls, code: MessageCode, **kwargs) -> Message:
+    def log_error(cls, code: MessageCode, **kwargs) -> Optional[Message]:
         """Log an error message."""
         return cls.log_message(code, message_type=MessageType.ERROR, **kwargs)
     
     @classmethod
-    def log_warning(cls, code: MessageCode, **kwargs) -> Message:
+    def log_warning(cls, code: MessageCode, **kwargs) -> Optional[Message]:
         """Log a warning message."""
         return cls.log_message(code, message_type=MessageType.WARNING, **kwargs)
     
     @classmethod
-    def log_info(cls, code: MessageCode, **kwargs) -> Message:
+    def log_info(cls, code: MessageCode, **kwargs) -> Optional[Message]:
         """Log an info message."""
         return cls.log_message(code, message_type=MessageType.INFO, **kwargs)
     
     @classmethod
-    def log_progress(cls, code: MessageCode, inline: bool = False, **kwargs) -> Message:
+    def log_progress(cls, code: MessageCode, inline: bool = False, **kwargs) -> Optional[Message]:
         """Log a progress message, with an option for inline updating if needed."""
         return cls.log_message(code, message_type=MessageType.PROGRESS, inline=inline, **kwargs)
\ No newline at end of file
@@ -4,10 +4,33 @@ Handles cleaning and preprocessing of raw text transcripts.
 """
 
 import re
+from bisect import bisect_right
 from typing import List
 import config
 from core.message_system import MessageSystem, MessageCode
 
+# Patterns used by clean_transcript, compiled once at import
+# Common filler words, vocalizations, and disfluencies:
+# um, uh, hmm, er, eh, ah, like, you know, I mean, so, well, right, okay, actually, basically, literally.
+# The lookahead rejects word starts that cannot begin a filler before any alternative is tried,
+# and alternatives sharing a prefix are merged so the engine backtracks less per word.
+_FILLER_RE = re.compile(
+    r'\b(?=[abehilorsuwy])(?:u[mh]|hmm|e[rh]|ah|like|you know|I mean|so|well|right|okay|actually|basically|literally)\b',
+    re.IGNORECASE
+)
+# A word followed by one or more runs of punctuation/spaces and the same word again (e.g., "Yes. Yes, yes" or "word word").
+# The repeats are consumed in a single match so one pass removes the whole run.
+# The word and each separator run are captured in a lookahead and then matched by backreference,
+# which makes them atomic: separators never contain word characters, so giving back part of either
+# could not produce a match, and skipping those retries saves work at every word that is not repeated.
+_REPETITION_RE = re.compile(r"\b(?=(\w+))\1((?:(?=([\s,.!?\"'`\-–—]{1,15}))\3\1\b)+)", re.IGNORECASE)
+_WORD_RE = re.compile(r'\w+')
+# Sentence end followed by a space; split_into_chunks prefers to cut right after one
+_SENTENCE_BREAK_RE = re.compile(r'[.!?] ')
+
+# Punctuation that must not be preceded by a space
+_CLOSING_PUNCTUATION = ',.!?'
+
 class TextProcessor:
     """
     Handles cleaning and chunking of raw text transcripts before AI processing.
@@ -33,28 +56,32 @@ class TextProcessor:
             str: Cleaned and normalized text
         """
         # Normalize whitespace to single spaces
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = ' '.join(text.split())
 
         # Remove common filler words, vocalizations, and disfluencies
-        filler_pattern = r'\b(um|uh|hmm|er|ah|eh|like|you know|I mean|so|well|right|okay|actually|basically|literally)\b'
-        text = re.sub(filler_pattern, '', text, flags=re.IGNORECASE)
+        text, fillers_removed = _FILLER_RE.subn('', text)
 
         # Handle word repetitions (e.g., "Yes. Yes," or "word word")
-        # Pattern finds a word followed by punctuation/spaces and the same word again
-        repetition_pattern = re.compile(r"(\b\w+\b)([\s,.!?\"'`\-–—]{1,15})\1\b", flags=re.IGNORECASE)
-        while True:
-            new_text = repetition_pattern.sub(r'\1\2', text)
-            if new_text == text:
-                break
-            text = new_text
+        text, repetitions_collapsed = _REPETITION_RE.subn(self._collapse_repetition, text)
 
         # Clean up formatting artifacts
-        text = re.sub(r'\s+([,.!?])', r'\1', text)  # Remove spaces before punctuation
-        text = re.sub(r' +', ' ', text).strip()      # Normalize multiple spaces
+        # Normalize multiple spaces left by removals (if nothing was removed the text is still normalized),
+        # then remove the single space left before punctuation.
+        # Only plain spaces need handling because whitespace is normalized first, and
+        # str.split/join and literal str.replace run in C without going through the regex engine.
+        if fillers_removed or repetitions_collapsed:
+            text = ' '.join(text.split())
+        for mark in _CLOSING_PUNCTUATION:
+            text = text.replace(' ' + mark, mark)
 
         MessageSystem.log_success(MessageCode.TEXT_CLEANING_SUCCESS)
         return text
 
+    @staticmethod
+    def _collapse_repetition(match: re.Match) -> str:
+        """Keep the first occurrence of a repeated word followed by the separators of the whole run."""
+        return match.group(1) + _WORD_RE.sub('', match.group(2))
+
     def split_into_chunks(self, text: str) -> List[str]:
         """
         Split large text into manageable chunks while respecting sentence boundaries.
@@ -73,6 +100,9 @@ class TextProcessor:
 
         MessageSystem.log_progress(MessageCode.TEXT_CHUNKING_START, size=self.chunk_size)
 
+        # Index every sentence break once; each chunk then finds its cut point by binary search
+        breaks = [match.start() for match in _SENTENCE_BREAK_RE.finditer(text)]
+
         chunks = []
         current_pos = 0
         
@@ -81,17 +111,19 @@ class TextProcessor:
 
             # Try to find natural sentence break points near the end position
             if end_pos < len(text):
-                last_break = max(
-                    text.rfind('. ', current_pos, end_pos),
-                    text.rfind('? ', current_pos, end_pos),
-                    text.rfind('! ', current_pos, end_pos)
-                )
-                if last_break != -1:
-                    end_pos = last_break + 1
-
-            chunk = text[current_pos:end_pos].strip()
-            if chunk:  # Only add non-empty chunks
-                chunks.append(chunk)
+                # Last break whose two characters both fit before end_pos
+                idx = bisect_right(breaks, end_pos - 2) - 1
+                if idx >= 0 and breaks[idx] >= current_pos:
+                    end_pos = breaks[idx] + 1
+
+            # Trim surrounding whitespace by moving the bounds, so each chunk is sliced exactly once
+            chunk_start, chunk_end = current_pos, end_pos
+            while chunk_start < chunk_end and text[chunk_start].isspace():
+                chunk_start += 1
+            while chunk_end > chunk_start and text[chunk_end - 1].isspace():
+                chunk_end -= 1
+            if chunk_start < chunk_end:  # Only add non-empty chunks
+                chunks.append(text[chunk_start:chunk_end])
             
             current_pos = end_pos
 
@@ -0,0 +1,17 @@
+"""
+Gunicorn configuration for TalkToText Pro-v1.0 Engine
+Production entrypoint for the web app (Linux/macOS): gunicorn app:app
+"""
+
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+workers = int(os.getenv("GUNICORN_WORKERS", "4"))
+
+# The web tier is I/O-bound (MongoDB, Redis, uploads, status polling), so gevent workers
+# monkey-patch the standard library and let each worker serve many requests concurrently.
+worker_class = "gevent"
+worker_connections = 1000
+
+# Large uploads are streamed to disk inside a single request
+timeout = 120
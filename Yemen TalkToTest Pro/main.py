@@ -4,8 +4,9 @@ Professional audio processing and transcription system with AI-powered summariza
 """
 
 import os
-import shutil
+import time
 import datetime
+from concurrent.futures import ThreadPoolExecutor, wait
 from dotenv import load_dotenv
 from bson.objectid import ObjectId
 
@@ -14,17 +15,21 @@ from core.audio_processor import AudioProcessor
 from core.text_processor import TextProcessor
 from core.ai_services import AIServices
 from core.database_manager import DatabaseManager
+from core.cache_manager import CacheManager
 from core.message_system import MessageSystem, MessageCode
 from utils.custom_exceptions import ProjectBaseException, FileSystemError, IrrelevantContentError
+from utils.file_utils import remove_directory_tree
 
 class MainPipeline:
     """
     Main processing pipeline that orchestrates audio processing, transcription, and summarization.
     """
     
-    def __init__(self, api_key: str, audio_quality: str, ffmpeg_path: str, ffprobe_path: str, db_manager: DatabaseManager):
+    def __init__(self, api_key: str, audio_quality: str, ffmpeg_path: str, ffprobe_path: str, db_manager: DatabaseManager,
+                 cache_manager: CacheManager = None):
         """
         Initialize pipeline with all required components and services.
+        The optional cache_manager lets AI screening reuse earlier decisions.
         """
         bitrate = config.QUALITY_PRESETS.get(audio_quality, config.QUALITY_PRESETS["medium"])
         
@@ -34,14 +39,19 @@ class MainPipeline:
             ffprobe_path=ffprobe_path
         )
         self.text_processor = TextProcessor()
-        self.ai_services = AIServices(api_key=api_key)
+        self.ai_services = AIServices(api_key=api_key, cache_manager=cache_manager)
         self.db_manager = db_manager
+        # Processing data (transcripts, reports) is written here so the next AI call does not wait on MongoDB
+        self.persist_executor = ThreadPoolExecutor(max_workers=config.PROCESSING_DATA_WRITERS)
 
     def _execute_step(self, job_id: ObjectId, stage: str, step_name: str, func, *args, **kwargs):
         """
         Execute and log pipeline step with timing and error handling.
+        The wall clock is read once for the start timestamp; the duration comes from the
+        monotonic clock, which is cheaper to read and unaffected by system clock changes.
         """
         start_time = datetime.datetime.now(datetime.timezone.utc)
+        start_ns = time.monotonic_ns()
         message = ""
         
         try:
@@ -53,14 +63,24 @@ class MainPipeline:
                 result = result[0]
                 
         except Exception as e:
-            end_time = datetime.datetime.now(datetime.timezone.utc)
+            end_time = start_time + datetime.timedelta(microseconds=(time.monotonic_ns() - start_ns) // 1000)
             self.db_manager.add_log_entry(job_id, stage, step_name, "failed", start_time, end_time, str(e))
             raise
         
-        end_time = datetime.datetime.now(datetime.timezone.utc)
+        end_time = start_time + datetime.timedelta(microseconds=(time.monotonic_ns() - start_ns) // 1000)
         self.db_manager.add_log_entry(job_id, stage, step_name, status, start_time, end_time, message)
         return result
 
+    def _persist_processing_data(self, pending_writes: list, job_id: ObjectId, field_to_update: dict):
+        """
+        Write processing data in the background and track the write in pending_writes.
+        Each write sets different fields, so the writes may complete in any order. Buffered event log
+        entries are left to the status and result updates made on the pipeline thread.
+        """
+        pending_writes.append(self.persist_executor.submit(
+            self.db_manager.update_job_processing_data, job_id, field_to_update, attach_events=False
+        ))
+
     def _handle_url_input(self, url: str, temp_dir: str, job_id: ObjectId) -> tuple[str, bool]:
         """
         Handle URL input with metadata analysis and smart screening.
@@ -83,12 +103,20 @@ class MainPipeline:
         
         return downloaded_file, (decision != "proceed")
 
-    def run(self, input_path_or_url: str, user_id: ObjectId, audio_quality: str = "medium", target_language_name: str = None, job_id_for_temp_dir: str = None):
+    def run(self, input_path_or_url: str, user_id: ObjectId, audio_quality: str = "medium", target_language_name: str = None, job_id_for_temp_dir: str = None, content_hash: str = None,
+            on_stage=None):
         """
         Execute complete processing pipeline for given input.
         The temporary directory is now managed by the calling function to ensure cleanup.
+        The optional on_stage callback receives each processing stage name as the job reaches it.
         """
+        def set_stage(stage: str):
+            self.db_manager.update_job_status(job_id, stage)
+            if on_stage:
+                on_stage(stage)
+
         job_id = None
+        pending_writes = []
         
         try:
             # Dynamically set audio quality for this specific job
@@ -98,7 +126,7 @@ class MainPipeline:
             source_type = "url" if is_url else "file"
             
             # Use the provided job_id from app.py to create a job record in the DB
-            job_id_obj = self.db_manager.create_job(user_id, source_type, input_path_or_url)
+            job_id_obj = self.db_manager.create_job(user_id, source_type, input_path_or_url, content_hash)
             job_id = job_id_obj # Keep ObjectId for DB operations
 
             MessageSystem.log_progress(MessageCode.PIPELINE_START, job_id=job_id)
@@ -106,10 +134,10 @@ class MainPipeline:
             # The temp directory path is now determined by the job_id from the calling function
             temp_dir = f"temp_{job_id_for_temp_dir}"
             if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
+                remove_directory_tree(temp_dir)
             os.makedirs(temp_dir)
             
-            self.db_manager.update_job_status(job_id, "processing_audio")
+            set_stage("processing_audio")
             
             if is_url:
                 initial_audio_file, needs_audio_screening = self._handle_url_input(input_path_or_url, temp_dir, job_id)
@@ -133,49 +161,36 @@ class MainPipeline:
                     screening_clip
                 )
             
-            converted_audio = self._execute_step(
-                job_id, "audio_processing", "standardize_audio",
-                self.audio_processor.convert_to_standard_mp3,
-                initial_audio_file,
-                os.path.join(temp_dir, "converted.mp3")
-            )
-            
-            cleaned_audio = self._execute_step(
-                job_id, "audio_processing", "clean_audio",
-                self.audio_processor.clean_audio,
-                converted_audio,
-                os.path.join(temp_dir, "cleaned.mp3")
-            )
-            
-            audio_chunks = self._execute_step(
-                job_id, "audio_processing", "chunk_audio",
-                self.audio_processor.chunk_audio,
-                cleaned_audio,
-                os.path.join(temp_dir, "chunks")
-            )
+            # Standardizing/cleaning/chunking (one FFmpeg run) and transcription (Whisper) are pipelined:
+            # each chunk is transcribed as soon as FFmpeg has written it
+            audio_chunks = []
+            def produce_chunks():
+                for chunk_path in self.audio_processor.convert_clean_and_chunk(initial_audio_file, os.path.join(temp_dir, "chunks")):
+                    audio_chunks.append(chunk_path)
+                    yield chunk_path
             
-            self.db_manager.update_job_status(job_id, "transcribing")
+            set_stage("transcribing")
             raw_transcript = self._execute_step(
-                job_id, "transcription", "transcribe",
-                self.ai_services.transcribe_audio_files,
-                audio_chunks
+                job_id, "transcription", "convert_chunk_transcribe",
+                self.ai_services.transcribe_audio_stream,
+                produce_chunks()
             )
-            self.db_manager.update_job_processing_data(job_id, {"transcription.rawTranscript": raw_transcript})
+            self._persist_processing_data(pending_writes, job_id, {"transcription.rawTranscript": raw_transcript})
             
-            self.db_manager.update_job_status(job_id, "processing_text")
+            set_stage("processing_text")
             cleaned_transcript = self._execute_step(
                 job_id, "text_processing", "clean_transcript",
                 self.text_processor.clean_transcript,
                 raw_transcript
             )
-            self.db_manager.update_job_processing_data(job_id, {"transcription.cleanedTranscript": cleaned_transcript})
+            self._persist_processing_data(pending_writes, job_id, {"transcription.cleanedTranscript": cleaned_transcript})
             
             detected_lang = self._execute_step(
                 job_id, "text_processing", "detect_language",
                 self.ai_services.detect_language,
                 cleaned_transcript
             )
-            self.db_manager.update_job_processing_data(job_id, {"language.detectedLanguage": detected_lang})
+            self._persist_processing_data(pending_writes, job_id, {"language.detectedLanguage": detected_lang})
             
             if detected_lang != 'en':
                 english_transcript = self._execute_step(
@@ -185,18 +200,18 @@ class MainPipeline:
                 )
             else:
                 english_transcript = cleaned_transcript
-            self.db_manager.update_job_processing_data(job_id, {
+            self._persist_processing_data(pending_writes, job_id, {
                 "language.wasTranslated": detected_lang != 'en',
                 "language.finalTranscript": english_transcript
             })
             
-            self.db_manager.update_job_status(job_id, "summarizing")
+            set_stage("summarizing")
             final_summary = self._execute_step(
                 job_id, "summarization", "generate_summary",
                 self.ai_services.summarize_text,
                 english_transcript
             )
-            self.db_manager.update_job_processing_data(job_id, {"summary.fullReport": final_summary})
+            self._persist_processing_data(pending_writes, job_id, {"summary.fullReport": final_summary})
             
             translated_summary = None
             if target_language_name and target_language_name.lower() != 'auto':
@@ -207,7 +222,7 @@ class MainPipeline:
                     target_language_name
                 )
                 if translated_summary:
-                    self.db_manager.update_job_processing_data(job_id, {
+                    self._persist_processing_data(pending_writes, job_id, {
                         "summary.translatedReport": {"language": target_language_name, "text": translated_summary}
                     })
 
@@ -221,6 +236,9 @@ class MainPipeline:
             if translated_summary and target_language_name:
                 final_results["summary"]["translatedReport"] = {"language": target_language_name, "text": translated_summary}
 
+            # Surface any failed background write before the job is marked completed
+            for write in pending_writes:
+                write.result()
             self.db_manager.save_job_results(job_id, final_results)
             self.db_manager.update_job_status(job_id, "completed")
             MessageSystem.log_success(MessageCode.PIPELINE_SUCCESS)
@@ -236,4 +254,11 @@ class MainPipeline:
             MessageSystem.log_error(MessageCode.UNEXPECTED_ERROR, error=str(e))
             if job_id:
                 self.db_manager.update_job_status(job_id, "failed", "critical_error", str(e))
-            raise
\ No newline at end of file
+            raise
+
+        finally:
+            # Let background writes finish before the job is handed back
+            wait(pending_writes)
+            # Event log entries are buffered; make sure none are left behind if the status update failed
+            if job_id:
+                self.db_manager.flush_events(job_id)
\ No newline at end of file
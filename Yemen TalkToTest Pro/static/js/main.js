@@ -114,39 +114,35 @@ document.addEventListener('DOMContentLoaded', () => {
   }
 
   function checkJobStatus(jobId, fileName) {
-    const interval = setInterval(() => {
-      fetch(`/job_status/${jobId}`)
-        .then(response => response.json())
-        .then(data => {
-          if (data.success) {
-            if (data.status === 'completed') {
-              clearInterval(interval);
-              showResultsView('result', fileName, data.data, jobId);
-              loadHistory();
-              uploadButton.innerHTML = 'Upload Audio';
-              uploadButton.disabled = false;
-            } else if (data.status === 'failed') {
-              clearInterval(interval);
-              loadHistory();
-              alert('Error during processing: ' + data.error);
-              uploadButton.innerHTML = 'Upload Audio';
-              uploadButton.disabled = false;
-            }
-          } else {
-            clearInterval(interval);
-            alert('Error checking job status: ' + data.error);
-            uploadButton.innerHTML = 'Upload Audio';
-            uploadButton.disabled = false;
-          }
-        })
-        .catch(error => {
-          clearInterval(interval);
-          console.error('Error:', error);
-          alert('An error occurred while checking job status.');
-          uploadButton.innerHTML = 'Upload Audio';
-          uploadButton.disabled = false;
-        });
-    }, 3000);
+    // The server pushes each status change over one Server-Sent Events stream
+    const events = new EventSource(`/job_events/${jobId}`);
+
+    events.onmessage = (event) => {
+      const data = JSON.parse(event.data);
+      if (data.status === 'completed') {
+        events.close();
+        showResultsView('result', fileName, data.data, jobId);
+        loadHistory();
+        uploadButton.innerHTML = 'Upload Audio';
+        uploadButton.disabled = false;
+      } else if (data.status === 'failed') {
+        events.close();
+        loadHistory();
+        alert('Error during processing: ' + data.error);
+        uploadButton.innerHTML = 'Upload Audio';
+        uploadButton.disabled = false;
+      }
+    };
+
+    events.onerror = (error) => {
+      // EventSource reconnects by itself after dropped connections; CLOSED means it gave up
+      if (events.readyState === EventSource.CLOSED) {
+        console.error('Error:', error);
+        alert('An error occurred while checking job status.');
+        uploadButton.innerHTML = 'Upload Audio';
+        uploadButton.disabled = false;
+      }
+    };
   }
 
   function uploadFiles(files) {
@@ -184,14 +180,18 @@ document.addEventListener('DOMContentLoaded', () => {
       .finally(() => { fileInput.value = ''; });
   }
   
-  function loadHistory() {
-    fetch('/history')
-      .then(response => response.json())
-      .then(data => {
-        historyList.querySelectorAll('.history-item').forEach(item => item.remove());
+  // The server returns history one page at a time; page 1 replaces the list, later pages append to it
+  function loadHistory(page = 1) {
+    fetch(`/history?page=${page}`)
+      .then(response => response.json().then(data => ({ data, nextPage: response.headers.get('X-Next-Page') })))
+      .then(({ data, nextPage }) => {
+        historyList.querySelectorAll('.load-more-btn').forEach(button => button.remove());
+        if (page === 1) {
+          historyList.querySelectorAll('.history-item').forEach(item => item.remove());
+        }
 
         if (data.length === 0) {
-          historyEmpty.style.display = 'block';
+          if (page === 1) historyEmpty.style.display = 'block';
         } else {
           historyEmpty.style.display = 'none';
           data.forEach(item => {
@@ -258,6 +258,20 @@ document.addEventListener('DOMContentLoaded', () => {
             historyList.appendChild(historyItem);
           });
         }
+
+        if (nextPage) {
+          const loadMoreButton = document.createElement('button');
+          loadMoreButton.className = 'load-more-btn';
+          loadMoreButton.textContent = 'Load more';
+          loadMoreButton.addEventListener('click', () => {
+            loadMoreButton.disabled = true;
+            loadHistory(Number(nextPage));
+          });
+          historyList.appendChild(loadMoreButton);
+        }
+
+        // Keep an active search applied to newly loaded items
+        if (historySearch && historySearch.value) historySearch.dispatchEvent(new Event('input'));
       })
       .catch(error => console.error('Error loading history:', error));
   }
@@ -0,0 +1,102 @@
+"""
+Tests for the web app's upload hashing and history pagination.
+MongoDB, Redis and the pipeline are replaced with mocks before app is imported.
+"""
+
+import datetime
+import hashlib
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from bson.objectid import ObjectId
+
+import config
+
+app_module = None
+
+
+def setUpModule():
+    global app_module
+    patches = [
+        mock.patch.dict(os.environ, {"MONGO_CONNECTION_STRING": "mongodb://localhost:27017",
+                                     "OPENAI_API_KEY": "test-key", "SECRET_KEY": "test-secret"}),
+        mock.patch("core.cache_manager.CacheManager"),
+        mock.patch("core.database_manager.DatabaseManager"),
+        mock.patch("main.MainPipeline"),
+    ]
+    for patch in patches:
+        patch.start()
+    try:
+        sys.modules.pop("app", None)
+        app_module = importlib.import_module("app")
+    finally:
+        for patch in reversed(patches):
+            patch.stop()
+
+
+def make_job(index):
+    return {
+        "_id": ObjectId(),
+        "source": {"value": f"uploads/meeting_{index}.mp3"},
+        "createdAt": datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc),
+        "status": "processing",
+    }
+
+
+class HashingFileTargetTests(unittest.TestCase):
+
+    def test_digest_matches_written_file(self):
+        chunks = [b"ID3", os.urandom(4096), b"", os.urandom(100000)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "upload.part")
+            target = app_module.HashingFileTarget(path)
+            target.start()
+            for chunk in chunks:
+                target.data_received(chunk)
+            target.finish()
+
+            with open(path, "rb") as written:
+                self.assertEqual(written.read(), b"".join(chunks))
+        self.assertEqual(target.digest.hexdigest(), hashlib.sha256(b"".join(chunks)).hexdigest())
+
+
+class HistoryPaginationTests(unittest.TestCase):
+
+    def setUp(self):
+        self.client = app_module.app.test_client()
+        self.user_id = ObjectId()
+        self.client.set_cookie(config.AUTH_COOKIE_NAME, app_module.issue_auth_token(self.user_id, "Test"))
+        self.db_manager = mock.patch.object(app_module, "db_manager").start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_full_page_links_next_page(self):
+        self.db_manager.get_user_jobs.return_value = [make_job(i) for i in range(config.HISTORY_PAGE_SIZE)]
+        response = self.client.get("/history?page=2")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers.get("X-Next-Page"), "3")
+        self.assertEqual(len(response.get_json()), config.HISTORY_PAGE_SIZE)
+        self.db_manager.get_user_jobs.assert_called_once_with(self.user_id, page=2)
+
+    def test_partial_page_is_last(self):
+        self.db_manager.get_user_jobs.return_value = [make_job(i) for i in range(3)]
+        response = self.client.get("/history")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Next-Page", response.headers)
+        self.db_manager.get_user_jobs.assert_called_once_with(self.user_id, page=1)
+
+    def test_page_below_one_links_page_two(self):
+        self.db_manager.get_user_jobs.return_value = [make_job(i) for i in range(config.HISTORY_PAGE_SIZE)]
+        response = self.client.get("/history?page=0")
+        self.assertEqual(response.headers.get("X-Next-Page"), "2")
+
+    def test_logged_out_gets_401(self):
+        self.client.delete_cookie(config.AUTH_COOKIE_NAME)
+        self.assertEqual(self.client.get("/history").status_code, 401)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Tests for DatabaseManager helpers that do not need a MongoDB server.
+"""
+
+import unittest
+
+from core.database_manager import DatabaseManager
+
+
+class FlattenToDotPathsTests(unittest.TestCase):
+
+    def setUp(self):
+        # The helper only needs the instance, not a connection
+        self.db_manager = DatabaseManager.__new__(DatabaseManager)
+
+    def test_nested_leaves_become_dot_paths(self):
+        data = {
+            "transcription": {"rawTranscript": "raw", "cleanedTranscript": "clean"},
+            "summary": {"english": {"abstract": "a", "keyPoints": ["k1", "k2"]}},
+            "status": "done"
+        }
+        self.assertEqual(self.db_manager._flatten_to_dot_paths(data, "processing"), {
+            "processing.transcription.rawTranscript": "raw",
+            "processing.transcription.cleanedTranscript": "clean",
+            "processing.summary.english.abstract": "a",
+            "processing.summary.english.keyPoints": ["k1", "k2"],
+            "processing.status": "done"
+        })
+
+    def test_empty_dicts_are_set_as_values(self):
+        # An empty dict has no leaves, so it is kept whole rather than dropped
+        self.assertEqual(self.db_manager._flatten_to_dot_paths({"language": {}, "meta": {"tags": {}}}, "processing"),
+                         {"processing.language": {}, "processing.meta.tags": {}})
+
+    def test_empty_data(self):
+        self.assertEqual(self.db_manager._flatten_to_dot_paths({}, "processing"), {})
+
+    def test_deep_nesting_does_not_recurse(self):
+        data = leaf = {}
+        for _ in range(5000):
+            leaf["level"] = {}
+            leaf = leaf["level"]
+        leaf["value"] = 1
+        flat = self.db_manager._flatten_to_dot_paths(data, "processing")
+        self.assertEqual(list(flat.values()), [1])
+        self.assertEqual(next(iter(flat)), "processing" + ".level" * 5000 + ".value")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Tests for TextProcessor: the optimized cleaning and chunking must give the same output
+as the original regex implementation they replaced.
+"""
+
+import contextlib
+import io
+import random
+import re
+import unittest
+
+from core.text_processor import TextProcessor
+
+WORDS = ["the", "The", "um", "Um", "uh", "so", "well", "Yes", "yes", "YES", "go", "like", "you", "know",
+         "I", "mean", "okay", "right", "theory", "hmm", "er", "budget", "x1", "é", "data-driven"]
+SEPARATORS = [" ", "  ", ", ", ". ", "! ", "? ", " - ", "—", "\n", "\t", " , ", " . ", "'", '"', "...", " ,, "]
+
+
+def reference_remove_noise(text):
+    """The original clean_transcript up to its formatting cleanup."""
+    text = re.sub(r'\s+', ' ', text).strip()
+    filler_pattern = r'\b(um|uh|hmm|er|ah|eh|like|you know|I mean|so|well|right|okay|actually|basically|literally)\b'
+    text = re.sub(filler_pattern, '', text, flags=re.IGNORECASE)
+    repetition_pattern = re.compile(r"(\b\w+\b)([\s,.!?\"'`\-–—]{1,15})\1\b", flags=re.IGNORECASE)
+    while True:
+        new_text = repetition_pattern.sub(r'\1\2', text)
+        if new_text == text:
+            break
+        text = new_text
+    return text
+
+
+def reference_clean_transcript(text):
+    """The original clean_transcript."""
+    text = reference_remove_noise(text)
+    text = re.sub(r'\s+([,.!?])', r'\1', text)
+    return re.sub(r' +', ' ', text).strip()
+
+
+def reference_split_into_chunks(text, chunk_size):
+    """The original split_into_chunks."""
+    if not isinstance(text, str) or not text.strip():
+        return []
+    if len(text) <= chunk_size:
+        return [text]
+    chunks = []
+    current_pos = 0
+    while current_pos < len(text):
+        end_pos = min(current_pos + chunk_size, len(text))
+        if end_pos < len(text):
+            last_break = max(
+                text.rfind('. ', current_pos, end_pos),
+                text.rfind('? ', current_pos, end_pos),
+                text.rfind('! ', current_pos, end_pos)
+            )
+            if last_break != -1:
+                end_pos = last_break + 1
+        chunk = text[current_pos:end_pos].strip()
+        if chunk:
+            chunks.append(chunk)
+        current_pos = end_pos
+    return chunks
+
+
+def has_long_separator_run(text):
+    """
+    Whether removing noise leaves a separator run longer than 15 characters. The original repeated
+    its pass until nothing changed, so repeats removed in one pass could merge separators into a
+    run it then refused to match across; the single-pass cleaner collapses the whole run at once.
+    """
+    return re.search(r"[\s,.!?\"'`\-–—]{16,}", reference_remove_noise(text)) is not None
+
+
+def random_transcript(rng, max_words):
+    return "".join(rng.choice(WORDS) + rng.choice(SEPARATORS) for _ in range(rng.randint(0, max_words)))
+
+
+class TextProcessorTests(unittest.TestCase):
+
+    def setUp(self):
+        self.processor = TextProcessor()
+        # Silence the success/progress messages printed by every call
+        self.stdout = contextlib.redirect_stdout(io.StringIO())
+        self.stdout.__enter__()
+
+    def tearDown(self):
+        self.stdout.__exit__(None, None, None)
+
+    def test_clean_transcript_examples(self):
+        self.assertEqual(self.processor.clean_transcript("  Um, so the the budget ,  is   fine . "), ", the budget, is fine.")
+        self.assertEqual(self.processor.clean_transcript("Yes. Yes, yes we agreed"), "Yes., we agreed")
+        self.assertEqual(self.processor.clean_transcript(""), "")
+
+    def test_clean_transcript_matches_reference(self):
+        rng = random.Random(1)
+        checked = 0
+        while checked < 5000:
+            text = random_transcript(rng, 12)
+            if has_long_separator_run(text):
+                continue
+            checked += 1
+            self.assertEqual(self.processor.clean_transcript(text), reference_clean_transcript(text), repr(text))
+
+    def test_split_into_chunks_matches_reference(self):
+        rng = random.Random(2)
+        for chunk_size in (5, 10, 17, 40):
+            self.processor.chunk_size = chunk_size
+            for _ in range(1000):
+                text = random_transcript(rng, 30)
+                self.assertEqual(self.processor.split_into_chunks(text),
+                                 reference_split_into_chunks(text, chunk_size), repr(text))
+
+    def test_split_into_chunks_prefers_sentence_breaks(self):
+        self.processor.chunk_size = 25
+        self.assertEqual(self.processor.split_into_chunks("First one. Second sentence here. Third."),
+                         ["First one.", "Second sentence here.", "Third."])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+File utility functions for TalkToText Pro-v1.0 Engine
+Provides shared helpers for hashing and managing files on disk.
+"""
+
+import os
+import hashlib
+import threading
+from collections import deque
+
+# Read size used when hashing files, so memory use does not grow with file size
+HASH_READ_SIZE_BYTES = 1024 * 1024
+
+class BufferPool:
+    """
+    Thread-safe pool of reusable bytearray buffers for streaming file IO.
+    Sizes are rounded up to a power of two so buffers of similar requests can be shared,
+    and at most max_buffers idle buffers are kept per size.
+    """
+
+    def __init__(self, max_buffers: int = 8):
+        self.max_buffers = max_buffers
+        self._free = {}
+        self._lock = threading.Lock()
+
+    def get(self, size: int) -> bytearray:
+        """Return a buffer of at least size bytes, reusing an idle one when available."""
+        size = 1 << (size - 1).bit_length()
+        with self._lock:
+            free = self._free.get(size)
+            if free:
+                return free.pop()
+        return bytearray(size)
+
+    def put(self, buf: bytearray):
+        """Return a buffer to the pool. Callers must not keep views of it afterwards."""
+        with self._lock:
+            free = self._free.setdefault(len(buf), deque())
+            if len(free) < self.max_buffers:
+                free.append(buf)
+
+# Shared by all streaming reads in the process
+buffer_pool = BufferPool()
+
+def sha256_file(file_path: str) -> str:
+    """Return the hex SHA-256 digest of a file, reading it into a pooled buffer block by block."""
+    digest = hashlib.sha256()
+    buf = buffer_pool.get(HASH_READ_SIZE_BYTES)
+    try:
+        with memoryview(buf) as view, open(file_path, "rb", buffering=0) as f:
+            while n := f.readinto(buf):
+                digest.update(view[:n])
+    finally:
+        buffer_pool.put(buf)
+    return digest.hexdigest()
+
+def remove_directory_tree(dir_path: str):
+    """
+    Delete a directory and everything inside it.
+    
+    Walks the tree iteratively with os.scandir, whose entries already carry their type,
+    so each file costs a single unlink instead of the stat + unlink of a generic rmtree.
+    """
+    pending = [dir_path]
+    visited_dirs = []
+    while pending:
+        current_dir = pending.pop()
+        visited_dirs.append(current_dir)
+        with os.scandir(current_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                else:
+                    os.unlink(entry.path)
+
+    # Children were visited after their parents, so remove directories in reverse order
+    for directory in reversed(visited_dirs):
+        os.rmdir(directory)
@@ -0,0 +1,29 @@
+"""
+JSON provider for TalkToText Pro-v1.0 Engine
+Serializes Flask responses and parses request bodies with orjson.
+"""
+
+from typing import Any, Union
+import orjson
+from bson.objectid import ObjectId
+from flask.json.provider import DefaultJSONProvider
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson; jsonify() and request.get_json() use it automatically."""
+
+    OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        """Serialize types orjson does not handle natively."""
+        if isinstance(o, ObjectId):
+            return str(o)
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string. Formatting kwargs such as indent are ignored."""
+        return orjson.dumps(obj, default=self.default, option=self.OPTIONS).decode("utf-8")
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)